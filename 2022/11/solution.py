@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
 # Advent of Code 2022 - Day 11
-from __future__ import annotations
-
 import operator
 import re
 from collections import Counter
@@ -43,7 +41,7 @@ class Monkey:
             else self._throw_to[1]
         )
 
-    def throw_to(self, other: Monkey):
+    def throw_to(self, other: "Monkey"):
         other.add_item(self.start_items.pop(0))
 
     def __repr__(self) -> str:
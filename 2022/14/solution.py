@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
+from my_utils import load_input
+
 SAMPLE_INPUT = """\
 498,4 -> 498,6 -> 496,6
 503,4 -> 502,4 -> 502,9 -> 494,9"""
 
-with open("day14.txt") as f:
-    lines = f.read().splitlines()
+lines = list(load_input(__file__).lines())
 
 sand_source = 500, 0
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
-import bisect
-import operator
-import re
+import numpy as np
+
+from my_utils import IntervalSet, extract_ints, load_input
 
 SAMPLE_INPUT = [
     "Sensor at x=2, y=18: closest beacon is at x=-2, y=15",
@@ -21,36 +21,14 @@ SAMPLE_INPUT = [
 ]
 
 
-class Intervals:
-    def __init__(self):
-        self._data = []
-
-    def __len__(self):
-        return sum(len(range(start, stop)) for start, stop in self._data)
-
-    def add(self, start, stop):
-        i = bisect.bisect_left(self._data, start, key=operator.itemgetter(1))
-        j = bisect.bisect_right(self._data, stop, key=operator.itemgetter(0))
-        if i < j:
-            start = min(start, self._data[i][0])
-            stop = max(stop, self._data[j - 1][1])
-        self._data[i:j] = [(start, stop)]
-
-    def itergaps(self, start, stop):
-        x = start
-        for span in self._data:
-            yield from range(x, span[0])
-            x = span[1]
-        yield from range(x, stop)
-
+def parse_input(lines):
+    """Sensor and beacon x, y as an int64 array with one row per sensor."""
+    return extract_ints("\n".join(lines), container="numpy").reshape(-1, 4)
 
-INTS = re.compile(r"-?\d+")
 
-
-def part1(lines, y=2000000):
-    intervals, beacons = Intervals(), set()
-    for line in lines:
-        x0, y0, x1, y1 = (int(match.group(0)) for match in INTS.finditer(line))
+def part1(sensors, y=2000000):
+    intervals, beacons = IntervalSet(), set()
+    for x0, y0, x1, y1 in sensors.tolist():
         delta = abs(x0 - x1) + abs(y0 - y1) - abs(y - y0)
         if delta >= 0:
             intervals.add(x0 - delta, x0 + delta + 1)
@@ -59,23 +37,101 @@ def part1(lines, y=2000000):
     return len(intervals) - len(beacons)
 
 
-def part2(lines, size=4000000):
-    inputs = [[int(match.group(0)) for match in INTS.finditer(line)] for line in lines]
-    for y in range(size + 1):
-        intervals = Intervals()
-        for x0, y0, x1, y1 in inputs:
-            delta = abs(x0 - x1) + abs(y0 - y1) - abs(y - y0)
-            start = max(0, x0 - delta)
-            stop = min(size, x0 + delta) + 1
-            if start < stop:
-                intervals.add(start, stop)
-        for x in intervals.itergaps(0, size + 1):
-            return 4000000 * x + y
+def _sensors(sensors):
+    """Sensor x, y and radius (distance to its beacon) as int64 arrays."""
+    sx, sy, bx, by = sensors.T
+    return sx, sy, np.abs(sx - bx) + np.abs(sy - by)
+
+
+def _uncovered(x, y, sx, sy, r):
+    """Mask of the points (x, y) that no sensor reaches."""
+    reach = np.abs(x[:, None] - sx) + np.abs(y[:, None] - sy)
+    return (reach > r).all(axis=1)
+
+
+def _boundary_search(sx, sy, r, size):
+    """
+    Finds the uncovered point from the lines just outside each sensor diamond.
+
+    In rotated coordinates u = x + y, v = x - y every diamond is a square, its
+    edges sitting on u = u0 +- r and v = v0 +- r. A gap hemmed in by diamonds
+    on every side lies where a u = u0 +- (r + 1) line crosses a
+    v = v0 +- (r + 1) line. One pressed against the border of the search
+    area lies where one of those lines meets it. That gives O(n^2)
+    candidates to test against every sensor instead of a sweep.
+
+    Lines that cross between lattice points contribute the four points
+    around the crossing, and the corners of the area are always tested.
+
+    Returns None if every candidate is covered. The candidates are not proven
+    complete for every layout, so the caller then falls back to _row_sweep().
+    """
+    us = np.unique(np.concatenate([sx + sy - r - 1, sx + sy + r + 1]))
+    vs = np.unique(np.concatenate([sx - sy - r - 1, sx - sy + r + 1]))
+    u, v = (a.ravel() for a in np.meshgrid(us, vs))
+    even = (u + v) % 2 == 0
+    corners = np.array([0, 0, size, size]), np.array([0, size, 0, size])
+    points = [corners, ((u[even] + v[even]) // 2, (u[even] - v[even]) // 2)]
+    # Lines crossing between lattice points: the four points around it.
+    x, y = (u[~even] + v[~even] - 1) // 2, (u[~even] - v[~even] - 1) // 2
+    points += [(x + dx, y + dy) for dx in (0, 1) for dy in (0, 1)]
+    # Where each line meets the edges x = 0, x = size, y = 0 and y = size.
+    for line, sign in ((us, 1), (vs, -1)):
+        zero, full = np.zeros_like(line), np.full_like(line, size)
+        points += [
+            (zero, sign * line),
+            (full, sign * (line - size)),
+            (line, zero),
+            (line - sign * size, full),
+        ]
+    x = np.concatenate([x for x, _ in points])
+    y = np.concatenate([y for _, y in points])
+    inside = (0 <= x) & (x <= size) & (0 <= y) & (y <= size)
+    x, y = x[inside], y[inside]
+    hits = np.flatnonzero(_uncovered(x, y, sx, sy, r))
+    if len(hits):
+        return int(x[hits[0]]), int(y[hits[0]])
     return None
 
 
-parts = (part1, part2)
-with open("day15.txt") as file:
-    lines = [line.rstrip() for line in file]
-    for part, func in enumerate(parts, 1):
-        print(f"Part {part}: {func(lines)}")
+def _row_sweep(sx, sy, r, size, block=4096):
+    """
+    Finds the first uncovered point row by row, `block` rows at a time.
+
+    Each row's sensor intervals are sorted by start and their running maximum
+    end is taken; a gap is wherever the next start lies beyond it. Works for
+    any layout, in O(size * n log n) vectorised steps.
+    """
+    for top in range(0, size + 1, block):
+        ys = np.arange(top, min(top + block, size + 1))[:, None]
+        half = r - np.abs(ys - sy)
+        hits = (half >= 0) & (sx + half >= 0) & (sx - half <= size)
+        lo = np.where(hits, np.maximum(sx - half, 0), size + 1)
+        hi = np.where(hits, np.minimum(sx + half, size), -1)
+        order = np.argsort(lo, axis=1)
+        lo = np.take_along_axis(lo, order, axis=1)
+        reach = np.maximum.accumulate(np.take_along_axis(hi, order, axis=1), axis=1)
+        before = np.hstack([np.full((len(ys), 1), -1), reach])
+        gap = np.hstack([lo > before[:, :-1] + 1, before[:, -1:] < size])
+        rows = np.flatnonzero(gap.any(axis=1))
+        if len(rows):
+            row = rows[0]
+            return int(before[row, gap[row].argmax()] + 1), top + int(row)
+    return None
+
+
+def part2(sensors, size=4000000):
+    sx, sy, r = _sensors(sensors)
+    point = _boundary_search(sx, sy, r, size)
+    if point is None:
+        point = _row_sweep(sx, sy, r, size)
+    if point is None:
+        return None
+    x, y = point
+    return 4000000 * x + y
+
+
+if __name__ == "__main__":
+    sensors = parse_input(load_input(__file__).lines())
+    for part, func in enumerate((part1, part2), 1):
+        print(f"Part {part}: {func(sensors)}")
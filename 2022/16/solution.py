@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
-import heapq
-import math
 import re
-from collections import defaultdict
-from dataclasses import dataclass
+
+import numpy as np
+
+from my_utils import load_input
 
 PATTERN = re.compile(
     r"Valve (\w+) has flow rate=(\d+); "
@@ -34,136 +34,106 @@ def _parse(lines):
     }
 
 
-def _distances(adj):
-    keys, distances = set(), defaultdict(lambda: math.inf)
-    for src, dsts in adj:
-        keys.add(src)
-        distances[src, src] = 0
-        for dst, weight in dsts:
-            keys.add(dst)
-            distances[dst, dst] = 0
-            distances[src, dst] = weight
-    for mid in keys:
-        for src in keys:
-            for dst in keys:
-                distance = distances[src, mid] + distances[mid, dst]
-                if distance < distances[src, dst]:
-                    distances[src, dst] = distance
-    return distances
-
-
-@dataclass(order=True, frozen=True)
-class _State:
-    rooms: tuple[tuple[str, int]]
-    valves: frozenset[str]
-    flow: int
-    total: int
-    time: int
-
-
-def _solve(lines, num_agents, total_time):
-    # pylint: disable=too-many-branches,too-many-nested-blocks,too-many-locals
-    graph = _parse(lines)
-    distances = _distances(
-        (src, ((dst, 1) for dst in dsts)) for src, (_, dsts) in graph.items()
-    )
-    seen, max_seen = set(), 0
-    heap = [
-        (
-            0,
-            _State(
-                rooms=(("AA", 0),) * num_agents,
-                valves=frozenset(src for src, (flow, _) in graph.items() if flow > 0),
-                flow=0,
-                total=0,
-                time=total_time,
-            ),
+def _distances(graph):
+    """All-pairs tunnel distances by Floyd-Warshall, one NumPy pass per hop."""
+    names = list(graph)
+    index = {name: i for i, name in enumerate(names)}
+    distances = np.full((len(names), len(names)), len(names), dtype=np.int64)
+    np.fill_diagonal(distances, 0)
+    for src, (_, dsts) in graph.items():
+        distances[index[src], [index[dst] for dst in dsts]] = 1
+    for mid in range(len(names)):
+        np.minimum(
+            distances, distances[:, mid, None] + distances[None, mid, :], out=distances
         )
-    ]
+    return names, distances
 
-    while heap:
-        estimate, state = heapq.heappop(heap)
-        estimate = -estimate
-        if state in seen:
-            continue
-        seen.add(state)
-        potential = estimate + sum(
-            max(
-                (
-                    graph[valve][0] * (state.time - delta - 1)
-                    for room, age in state.rooms
-                    if (delta := distances[room, valve] - age) in range(state.time)
-                ),
-                default=0,
-            )
-            for valve in state.valves
-        )
-        if estimate > max_seen:
-            max_seen = estimate
-        if potential < max_seen:
-            continue
 
-        moves_by_time = defaultdict(lambda: defaultdict(list))
-        for valve in state.valves:
-            for i, (room, age) in enumerate(state.rooms):
-                delta = distances[room, valve] - age
-                if delta in range(state.time):
-                    moves_by_time[delta][i].append(valve)
-        if not moves_by_time:
-            continue
+def parse_input(lines):
+    """
+    Keeps only the valves worth opening, plus the start.
 
-        for delta, moves_by_agent in moves_by_time.items():
-            indices = [None] * num_agents
-            while True:
-                for i, index in enumerate(indices):
-                    index = 0 if index is None else index + 1
-                    if index < len(moves_by_agent[i]):
-                        indices[i] = index
-                        break
-                    indices[i] = None
-                else:
-                    break
-                valves = [
-                    (i, moves_by_agent[i][index])
-                    for i, index in enumerate(indices)
-                    if index is not None
-                ]
-                if len(valves) != len(set(valve for _, valve in valves)):
-                    continue
-                new_rooms = [(room, age + delta + 1) for room, age in state.rooms]
-                for i, valve in valves:
-                    new_rooms[i] = valve, 0
-                rate = sum(graph[valve][0] for _, valve in valves)
-                new_state = _State(
-                    rooms=tuple(sorted(new_rooms)),
-                    valves=state.valves - set(valve for _, valve in valves),
-                    flow=state.flow + rate,
-                    total=state.total + state.flow * (delta + 1),
-                    time=state.time - delta - 1,
-                )
-                heapq.heappush(heap, (-estimate - rate * new_state.time, new_state))
-
-    return max_seen
-
-
-def part1(lines):
-    return _solve(lines, num_agents=1, total_time=30)
+    Returns their flow rates, the distance from each of them (and from the
+    start, as the last row) to each of them, and the number of useful valves.
+    """
+    graph = _parse(lines)
+    names, distances = _distances(graph)
+    useful = [i for i, name in enumerate(names) if graph[name][0] > 0]
+    flows = np.array([graph[names[i]][0] for i in useful])
+    rows = useful + [names.index("AA")]
+    return flows, distances[np.ix_(rows, useful)], len(useful)
+
+
+def _best_by_mask(flows, distances, total_time):
+    """
+    Most pressure released for every set of opened valves, as an array
+    indexed by bitmask.
+
+    States are (position, opened mask) bucketed by the time left, and only
+    the best pressure for each is kept. A valve's whole contribution is
+    counted when it opens, so buckets can be processed from the most time
+    left to the least. Each bucket is expanded against every valve at once.
+    """
+    count = len(flows)
+    bits = 1 << np.arange(count)
+    best = np.zeros(1 << count, dtype=np.int64)
+    buckets = [[] for _ in range(total_time + 1)]
+    buckets[total_time].append((np.array([count]), np.array([0]), np.array([0])))
+    for time in range(total_time, 0, -1):
+        if not buckets[time]:
+            continue
+        pos, mask, pressure = (np.concatenate(a) for a in zip(*buckets[time]))
+        buckets[time] = None
+        # Keep the best pressure per (position, mask).
+        key = mask * (count + 1) + pos
+        order = np.lexsort((-pressure, key))
+        key, pressure = key[order], pressure[order]
+        first = np.concatenate([[True], key[1:] != key[:-1]])
+        key, pressure = key[first], pressure[first]
+        pos, mask = key % (count + 1), key // (count + 1)
+        np.maximum.at(best, mask, pressure)
+
+        left = time - distances[pos] - 1
+        state, valve = np.nonzero((left > 0) & (mask[:, None] & bits == 0))
+        left = left[state, valve]
+        opened = mask[state] | bits[valve]
+        pressure = pressure[state] + flows[valve] * left
+        order = np.argsort(left, kind="stable")
+        times, starts = np.unique(left[order], return_index=True)
+        for t, group in zip(times, np.split(order, starts[1:])):
+            buckets[t].append((valve[group], opened[group], pressure[group]))
+    return best
+
+
+def part1(flows, distances, count):
+    return int(_best_by_mask(flows, distances, 30).max())
 
 
 def test_part1():
-    assert part1(SAMPLE_INPUT) == 1651
+    assert part1(*parse_input(SAMPLE_INPUT)) == 1651
 
 
-def part2(lines):
-    return _solve(lines, num_agents=2, total_time=26)
+def part2(flows, distances, count):
+    """
+    You and the elephant open disjoint sets of valves, so the answer is the
+    best over mask pairs with no bits in common. Taking the running max over
+    submasks makes the best partner for `mask` a single lookup of its
+    complement.
+    """
+    best = _best_by_mask(flows, distances, 26)
+    within = best.copy()
+    for bit in range(count):
+        halves = within.reshape(-1, 2, 1 << bit)
+        np.maximum(halves[:, 1], halves[:, 0], out=halves[:, 1])
+    # The complement of mask is full - mask, i.e. the array reversed.
+    return int((best + within[::-1]).max())
 
 
 def test_part2():
-    assert part2(SAMPLE_INPUT) == 1707
+    assert part2(*parse_input(SAMPLE_INPUT)) == 1707
 
 
-parts = (part1, part2)
-with open("day16.txt") as file:
-    lines = [line.strip() for line in file]
-    for part, func in enumerate(parts, 1):
-        print(f"Part {part}: {func(lines)}")
+if __name__ == "__main__":
+    valves = parse_input(load_input(__file__).lines())
+    for part, func in enumerate((part1, part2), 1):
+        print(f"Part {part}: {func(*valves)}")
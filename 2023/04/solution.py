@@ -3,23 +3,20 @@
 # https://adventofcode.com/2023
 # day 04
 
-import os
 import sys
 import unittest
 
 from loguru import logger
 
+from my_utils import load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
     def setUp(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, "example_input.txt")
-        with open(input_file, "r") as file:
-            lines = file.readlines()
-        self.input_data = parse_input(lines)
+        self.input_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1(self):
         self.assertEqual(part1(self.input_data), 13)
@@ -3,44 +3,33 @@
 # https://adventofcode.com/2023
 # day 07
 
-import os
 import sys
 import unittest
 from typing import Any, Dict, List, Tuple
 
 from loguru import logger
 
+from my_utils import load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = file.readlines()
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("example_input.txt"))
+        self.input_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(part1(self.input_data), 6440)
 
     def test_part1_solution(self):
-        self.assertEqual(
-            part1(parse_input(self.read_input_file("input.txt"))), 249726565
-        )
+        self.assertEqual(part1(load_input(__file__).parse(parse_input)), 249726565)
 
     def test_part2_example(self):
         self.assertEqual(part2(self.input_data), 5905)
 
     def test_part2_solution(self):
-        self.assertEqual(
-            part2(parse_input(self.read_input_file("input.txt"))), 251135960
-        )
+        self.assertEqual(part2(load_input(__file__).parse(parse_input)), 251135960)
 
 
 def score(hand: List[str], part: int = 1) -> int:
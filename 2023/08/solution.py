@@ -3,7 +3,6 @@
 # https://adventofcode.com/2023
 # day 08
 
-import os
 import re
 import sys
 import unittest
@@ -12,22 +11,16 @@ from math import lcm
 
 from loguru import logger
 
+from my_utils import load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.instructions, self.left, self.right, self.ws = parse_input(
-            self.read_input_file("input.txt")
+        self.instructions, self.left, self.right, self.ws = load_input(__file__).parse(
+            parse_input
         )
 
     def test_part1_example(self):
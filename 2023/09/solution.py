@@ -3,37 +3,30 @@
 # https://adventofcode.com/2023
 # day 09
 
-import os
 import sys
 import unittest
 from itertools import pairwise
 
 from loguru import logger
 
+from my_utils import load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("input.txt"))
+        self.input_data = load_input(__file__).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(
-            part1(parse_input(self.read_input_file("example_input.txt"))), 114
+            part1(load_input(__file__, example=True).parse(parse_input)), 114
         )
 
     def test_part2_example(self):
         self.assertEqual(
-            part2(parse_input(self.read_input_file("example_input.txt"))), 2
+            part2(load_input(__file__, example=True).parse(parse_input)), 2
         )
 
     def test_part1_solution(self):
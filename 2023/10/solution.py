@@ -3,37 +3,30 @@
 # https://adventofcode.com/2023
 # day 10
 
-import os
 import sys
 import unittest
 
 from loguru import logger
 
+from my_utils import load_input, shoelace
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data, self.start = parse_input(self.read_input_file("input.txt"))
+        self.input_data, self.start = load_input(__file__).parse(parse_input)
 
     def test_part1_example(self):
-        self.input_data, self.start = parse_input(
-            self.read_input_file("example_input.txt")
+        self.input_data, self.start = load_input(__file__, example=True).parse(
+            parse_input
         )
         self.assertEqual(part1(self.input_data, self.start), 8)
 
     def test_part2_example(self):
-        self.input_data, self.start = parse_input(
-            self.read_input_file("example_input.txt")
+        self.input_data, self.start = load_input(__file__, example=True).parse(
+            parse_input
         )
         self.assertEqual(part2(self.input_data, self.start), 1)
 
@@ -75,28 +68,26 @@ def parse_input(lines):
     return data, start
 
 
-def find_exit(data, start, is_part1):
-    q = [(c, start, 1, (c[0] - start[0]) * start[1]) for c in _get_exits(start, data)]
-    while q:
-        c, prev, l, area = q.pop()
-        if data[c[1]][c[0]] == "S":
-            if is_part1:
-                return l // 2
-            else:
-                return abs(area) - (l // 2) + 1
-        q.extend(
-            (next, c, l + 1, area + (next[0] - c[0]) * c[1])
-            for next in _get_exits(c, data)
-            if next != prev  # type: ignore
-        )
+def find_loop(data, start):
+    """Returns the cells of the loop through `start`, in order."""
+    for first in _get_exits(start, data):
+        loop, prev, c = [start], start, first
+        while c != start:
+            loop.append(c)
+            c, prev = next((n for n in _get_exits(c, data) if n != prev), None), c
+            if c is None:
+                break  # dead end, this neighbour only looked connected
+        else:
+            return loop
 
 
 def part1(data, start):
-    return find_exit(data, start, is_part1=True)
+    return len(find_loop(data, start)) // 2
 
 
 def part2(data, start):
-    return find_exit(data, start, is_part1=False)
+    # Pick's theorem over the loop's cells gives the enclosed tiles.
+    return shoelace(find_loop(data, start)).interior
 
 
 if __name__ == "__main__":
@@ -3,28 +3,21 @@
 # https://adventofcode.com/2023
 # day 11
 
-import os
 import sys
 import unittest
 
 from loguru import logger
 
+from my_utils import load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("input.txt"))
-        self.example_data = parse_input(self.read_input_file("example_input.txt"))
+        self.input_data = load_input(__file__).parse(parse_input)
+        self.example_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(part1(parse_input(self.example_data)), 374)
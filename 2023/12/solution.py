@@ -3,30 +3,22 @@
 # https://adventofcode.com/2023
 # day 12
 
-import os
 import sys
 import unittest
-from functools import lru_cache
 from typing import Tuple
 
 from loguru import logger
 
+from my_utils import load_input, memoize
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("input.txt"))
-        self.example_data = parse_input(self.read_input_file("example_input.txt"))
+        self.input_data = load_input(__file__).parse(parse_input)
+        self.example_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(part1(*self.example_data), 21)
@@ -52,7 +44,7 @@ def parse_input(lines):
     return records, damaged_springs
 
 
-@lru_cache
+@memoize
 def recursive_arrangements(springs: str, counts: Tuple[int, ...]) -> int:
     if len(springs) == 0:
         return 1 if len(counts) == 0 else 0
@@ -83,6 +75,8 @@ def part1(records, damaged_springs) -> int:
     for record, counts in zip(records, damaged_springs):
         counts = tuple(counts)
         total += recursive_arrangements(record, counts)
+        # Keep the cache bounded by a single record's sub-problems.
+        recursive_arrangements.cache_clear()
     return total
 
 
@@ -93,6 +87,7 @@ def part2(records, damaged_springs) -> int:
         record = "?".join([record] * 5)
         counts = counts * 5
         total += recursive_arrangements(record, counts)
+        recursive_arrangements.cache_clear()
     return total
 
 
@@ -3,28 +3,21 @@
 # https://adventofcode.com/2023
 # day 14
 
-import os
 import sys
 import unittest
 
 from loguru import logger
 
+from my_utils import fast_forward, load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("input.txt"))
-        self.example_data = parse_input(self.read_input_file("example_input.txt"))
+        self.input_data = load_input(__file__).parse(parse_input)
+        self.example_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(part1(self.example_data), 104)
@@ -55,8 +48,7 @@ def part1(data):
     return sum(row.count("O") * (len(data) - r) for r, row in enumerate(data))
 
 
-def cycle():
-    global grid
+def cycle(grid):
     for _ in range(4):
         grid = tuple(map("".join, zip(*grid)))
         grid = tuple(
@@ -69,30 +61,15 @@ def cycle():
             for row in grid
         )
         grid = tuple(row[::-1] for row in grid)
+    return grid
 
 
-def part2(data):
-    global grid
-    grid = tuple(data)
-
-    seen = {grid}
-    array = [grid]
-
-    iter = 0
-
-    while True:
-        iter += 1
-        cycle()
-        if grid in seen:
-            break
-        seen.add(grid)
-        array.append(grid)
-
-    first = array.index(grid)
+def load(grid):
+    return sum(row.count("O") * (len(grid) - r) for r, row in enumerate(grid))
 
-    grid = array[(1000000000 - first) % (iter - first) + first]
 
-    return sum(row.count("O") * (len(grid) - r) for r, row in enumerate(grid))
+def part2(data):
+    return fast_forward(cycle, tuple(data), 1000000000, observe=load)
 
 
 if __name__ == "__main__":
@@ -3,29 +3,22 @@
 # https://adventofcode.com/2023
 # day 16
 
-import os
 import sys
 import unittest
 from collections import deque
 
 from loguru import logger
 
+from my_utils import Grid, load_input
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("input.txt"))
-        self.example_data = parse_input(self.read_input_file("example_input.txt"))
+        self.input_data = load_input(__file__).parse(parse_input)
+        self.example_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(part1(self.example_data), 46)
@@ -41,102 +34,64 @@ class TestParts(unittest.TestCase):
 
 
 def parse_input(lines):
-    return lines
+    return Grid(lines)
 
 
-def part1(data):
-    # r, c, dr, dc
-    a = [(0, -1, 0, 1)]
-    seen = set()
-    q = deque(a)
+# Headings index Grid.offsets_4: 0=N, 1=E, 2=S, 3=W.
+_SLASH = ord("/")
+_BACKSLASH = ord("\\")
+_PIPE = ord("|")
+_DASH = ord("-")
 
-    while q:
-        r, c, dr, dc = q.popleft()
 
-        r += dr
-        c += dc
+def energize(grid, start, heading):
+    """Counts the cells a beam entering at `start` with `heading` passes through."""
+    cells, border, offsets = grid.cells, grid.border, grid.offsets_4
+    # One bit per heading for every cell a beam has crossed.
+    seen = bytearray(len(cells))
+    q = deque([(start, heading)])
+
+    while q:
+        i, d = q.popleft()
+        i += offsets[d]
+        ch = cells[i]
 
-        if r < 0 or r >= len(data) or c < 0 or c >= len(data[0]):
+        if ch == border:
             continue
 
-        ch = data[r][c]
-
-        if ch == "." or (ch == "-" and dc != 0) or (ch == "|" and dr != 0):
-            if (r, c, dr, dc) not in seen:
-                seen.add((r, c, dr, dc))
-                q.append((r, c, dr, dc))  # type: ignore
-        elif ch == "/":
-            dr, dc = -dc, -dr
-            if (r, c, dr, dc) not in seen:
-                seen.add((r, c, dr, dc))
-                q.append((r, c, dr, dc))  # type: ignore
-        elif ch == "\\":
-            dr, dc = dc, dr
-            if (r, c, dr, dc) not in seen:
-                seen.add((r, c, dr, dc))
-                q.append((r, c, dr, dc))  # type: ignore
+        if ch == _SLASH:
+            headings = (d ^ 1,)
+        elif ch == _BACKSLASH:
+            headings = (3 - d,)
+        elif ch == _PIPE and d & 1:
+            headings = (0, 2)
+        elif ch == _DASH and not d & 1:
+            headings = (1, 3)
         else:
-            for dr, dc in [(1, 0), (-1, 0)] if ch == "|" else [(0, 1), (0, -1)]:
-                if (r, c, dr, dc) not in seen:
-                    seen.add((r, c, dr, dc))
-                    q.append((r, c, dr, dc))  # type: ignore
+            headings = (d,)
 
-    coords = {(r, c) for (r, c, _, _) in seen}
+        for d in headings:
+            if not seen[i] & (1 << d):
+                seen[i] |= 1 << d
+                q.append((i, d))
 
-    return len(coords)
+    return len(cells) - seen.count(0)
 
 
-def part2(data):
-    def calc(r, c, dr, dc):
-        # r, c, dr, dc
-        a = [(r, c, dr, dc)]
-        seen = set()
-        q = deque(a)
-
-        while q:
-            r, c, dr, dc = q.popleft()
-
-            r += dr
-            c += dc
-
-            if r < 0 or r >= len(data) or c < 0 or c >= len(data[0]):
-                continue
-
-            ch = data[r][c]
-
-            if ch == "." or (ch == "-" and dc != 0) or (ch == "|" and dr != 0):
-                if (r, c, dr, dc) not in seen:
-                    seen.add((r, c, dr, dc))
-                    q.append((r, c, dr, dc))
-            elif ch == "/":
-                dr, dc = -dc, -dr
-                if (r, c, dr, dc) not in seen:
-                    seen.add((r, c, dr, dc))
-                    q.append((r, c, dr, dc))
-            elif ch == "\\":
-                dr, dc = dc, dr
-                if (r, c, dr, dc) not in seen:
-                    seen.add((r, c, dr, dc))
-                    q.append((r, c, dr, dc))
-            else:
-                for dr, dc in [(1, 0), (-1, 0)] if ch == "|" else [(0, 1), (0, -1)]:
-                    if (r, c, dr, dc) not in seen:
-                        seen.add((r, c, dr, dc))
-                        q.append((r, c, dr, dc))
-
-        coords = {(r, c) for (r, c, _, _) in seen}
-
-        return len(coords)
+def part1(data):
+    return energize(data, data.index(0, -1), 1)
 
+
+def part2(data):
     max_val = 0
 
-    for r in range(len(data)):
-        max_val = max(max_val, calc(r, -1, 0, 1))
-        max_val = max(max_val, calc(r, len(data[0]), 0, -1))
+    for r in range(data.height):
+        max_val = max(max_val, energize(data, data.index(r, -1), 1))
+        max_val = max(max_val, energize(data, data.index(r, data.width), 3))
 
-    for c in range(len(data)):
-        max_val = max(max_val, calc(-1, c, 1, 0))
-        max_val = max(max_val, calc(len(data), c, -1, 0))
+    for c in range(data.width):
+        max_val = max(max_val, energize(data, data.index(-1, c), 2))
+        max_val = max(max_val, energize(data, data.index(data.height, c), 0))
     return max_val
 
 
@@ -3,29 +3,21 @@
 # https://adventofcode.com/2023
 # day 17
 
-import os
 import sys
 import unittest
-from heapq import heappop, heappush
 
 from loguru import logger
 
+from my_utils import Grid, load_input, shortest_path
+
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
 
 class TestParts(unittest.TestCase):
-    @staticmethod
-    def read_input_file(filename):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        input_file = os.path.join(current_dir, filename)
-        with open(input_file, "r") as file:
-            lines = [line.strip() for line in file]
-        return lines
-
     def setUp(self):
-        self.input_data = parse_input(self.read_input_file("input.txt"))
-        self.example_data = parse_input(self.read_input_file("example_input.txt"))
+        self.input_data = load_input(__file__).parse(parse_input)
+        self.example_data = load_input(__file__, example=True).parse(parse_input)
 
     def test_part1_example(self):
         self.assertEqual(part1(self.example_data), 102)
@@ -41,70 +33,48 @@ class TestParts(unittest.TestCase):
 
 
 def parse_input(lines):
-    return [list(map(int, line.strip())) for line in lines]
+    return Grid(lines)
+
+
+def min_heat_loss(grid, min_run, max_run):
+    """
+    Shortest path over (cell, heading, run length) states packed into one int.
+
+    The crucible must move at least `min_run` blocks before turning or
+    stopping, and at most `max_run` blocks in a straight line.
+    """
+    cells, border, offsets = grid.cells, grid.border, grid.offsets_4
+    start = grid.index(0, 0)
+    goal = grid.index(grid.height - 1, grid.width - 1)
+    runs = max_run + 1
+
+    def moves(state):
+        i, n = divmod(state, runs)
+        i, d = divmod(i, 4)
+        if n < max_run:
+            j = i + offsets[d]
+            if cells[j] != border:
+                yield (j * 4 + d) * runs + n + 1, cells[j] - 48
+        if n >= min_run:
+            for nd in ((d + 1) % 4, (d + 3) % 4):
+                j = i + offsets[nd]
+                if cells[j] != border:
+                    yield (j * 4 + nd) * runs + 1, cells[j] - 48
+
+    def done(state):
+        return state // (4 * runs) == goal and state % runs >= min_run
+
+    # Heading east or south with an empty run lets the first move go either way.
+    starts = [(start * 4 + 1) * runs, (start * 4 + 2) * runs]
+    return shortest_path(starts, moves, goal=done, max_weight=9).cost
 
 
 def part1(data):
-    seen = set()
-    priority_queue = [(0, 0, 0, 0, 0, 0)]
-    heatloss = 0
-    while priority_queue:
-        heatloss, r, c, dr, dc, n = heappop(priority_queue)
-
-        if r == len(data) - 1 and c == len(data[0]) - 1:
-            break
-
-        if (r, c, dr, dc, n) in seen:
-            continue
-
-        seen.add((r, c, dr, dc, n))
-
-        if n < 3 and (dr, dc) != (0, 0):
-            nr = r + dr
-            nc = c + dc
-            if 0 <= nr < len(data) and 0 <= nc < len(data[0]):
-                heappush(priority_queue, (heatloss + data[nr][nc], nr, nc, dr, dc, n + 1))  # type: ignore
-
-        for ndr, ndc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            if (ndr, ndc) != (dr, dc) and (ndr, ndc) != (-dr, -dc):
-                nr = r + ndr
-                nc = c + ndc
-                if 0 <= nr < len(data) and 0 <= nc < len(data[0]):
-                    heappush(priority_queue, (heatloss + data[nr][nc], nr, nc, ndr, ndc, 1))  # type: ignore
-
-    return heatloss
+    return min_heat_loss(data, 0, 3)
 
 
 def part2(data):
-    seen = set()
-    priority_queue = [(0, 0, 0, 0, 0, 0)]
-    heatloss = 0
-
-    while priority_queue:
-        heatloss, r, c, dr, dc, n = heappop(priority_queue)
-
-        if r == len(data) - 1 and c == len(data[0]) - 1 and n >= 4:
-            break
-
-        if (r, c, dr, dc, n) in seen:
-            continue
-
-        seen.add((r, c, dr, dc, n))
-
-        if n < 10 and (dr, dc) != (0, 0):
-            nr = r + dr
-            nc = c + dc
-            if 0 <= nr < len(data) and 0 <= nc < len(data[0]):
-                heappush(priority_queue, (heatloss + data[nr][nc], nr, nc, dr, dc, n + 1))  # type: ignore
-
-        if n >= 4 or (dr, dc) == (0, 0):
-            for ndr, ndc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                if (ndr, ndc) != (dr, dc) and (ndr, ndc) != (-dr, -dc):
-                    nr = r + ndr
-                    nc = c + ndc
-                    if 0 <= nr < len(data) and 0 <= nc < len(data[0]):
-                        heappush(priority_queue, (heatloss + data[nr][nc], nr, nc, ndr, ndc, 1))  # type: ignore
-    return heatloss
+    return min_heat_loss(data, 4, 10)
 
 
 if __name__ == "__main__":
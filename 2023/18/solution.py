@@ -1,16 +1,60 @@
-## advent of code 2023
-## https://adventofcode.com/2023
-## day 18
+#!/usr/bin/env python3
+# advent of code 2023
+# https://adventofcode.com/2023
+# day 18
+
+import sys
+import unittest
+
+from loguru import logger
+
+from my_utils import load_input, trace
+
+logger.remove()
+logger.add(sys.stderr, level="INFO")
+
+
+class TestParts(unittest.TestCase):
+    def setUp(self):
+        self.input_data = load_input(__file__).parse(parse_input)
+        self.example_data = load_input(__file__, example=True).parse(parse_input)
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.example_data), 62)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.example_data), 952408144115)
+
+    def test_part1_solution(self):
+        self.assertEqual(part1(self.input_data), 28911)
+
+    def test_part2_solution(self):
+        self.assertEqual(part2(self.input_data), 77366737561114)
+
+
+# The last hex digit of a colour encodes the direction: 0=R, 1=D, 2=L, 3=U.
+_HEX_DIRECTIONS = "RDLU"
 
 
 def parse_input(lines):
-    return lines
+    plan = []
+    for line in lines:
+        direction, length, colour = line.split()
+        plan.append((direction, int(length), colour[2:-1]))
+    return plan
 
 
 def part1(data):
-    print(data)
-    pass
+    return trace((direction, length) for direction, length, _ in data).lattice_area
 
 
 def part2(data):
-    pass
+    moves = (
+        (_HEX_DIRECTIONS[int(colour[5])], int(colour[:5], 16)) for _, _, colour in data
+    )
+    return trace(moves).lattice_area
+
+
+if __name__ == "__main__":
+    logger.warning("Only running tests, you should run using Advent-CLI.")
+    unittest.main()
@@ -5,7 +5,7 @@
 from my_utils import setup_logging
 from collections import Counter
 
-logger = setup_logging(log_level="INFO")
+logger = setup_logging()
 
 
 def parse_input(lines):
@@ -27,7 +27,7 @@ def parse_input(lines):
         right_list.append(right)
 
     logger.debug(
-        f"Parsed input into left_list: {left_list} and right_list: {right_list}"
+        "Parsed input into left_list: {} and right_list: {}", left_list, right_list
     )
     return left_list, right_list
 
@@ -46,17 +46,19 @@ def part1(left_list, right_list):
     # Sort both lists
     left_sorted = sorted(left_list)
     right_sorted = sorted(right_list)
-    logger.debug(f"Sorted left_list: {left_sorted}")
-    logger.debug(f"Sorted right_list: {right_sorted}")
+    logger.debug("Sorted left_list: {}", left_sorted)
+    logger.debug("Sorted right_list: {}", right_sorted)
 
     # Calculate the total distance
+    debug = logger.debug_enabled
     total_distance = 0
     for left, right in zip(left_sorted, right_sorted):
         distance = abs(left - right)
         total_distance += distance
-        logger.debug(f"Pair ({left}, {right}) - Distance: {distance}")
+        if debug:
+            logger.debug("Pair ({}, {}) - Distance: {}", left, right, distance)
 
-    logger.debug(f"Total distance: {total_distance}")
+    logger.debug("Total distance: {}", total_distance)
     return total_distance
 
 
@@ -73,15 +75,20 @@ def part2(left_list, right_list):
         int: The total similarity score.
     """
     right_count = Counter(right_list)
-    logger.debug(f"Right list counts: {right_count}")
+    logger.debug("Right list counts: {}", right_count)
 
+    debug = logger.debug_enabled
     total_similarity_score = 0
     for num in left_list:
         score = num * right_count.get(num, 0)
         total_similarity_score += score
-        logger.debug(
-            f"Number {num} - Count in right_list: {right_count.get(num, 0)} - Score: {score}"
-        )
-
-    logger.debug(f"Total similarity score: {total_similarity_score}")
+        if debug:
+            logger.debug(
+                "Number {} - Count in right_list: {} - Score: {}",
+                num,
+                right_count.get(num, 0),
+                score,
+            )
+
+    logger.debug("Total similarity score: {}", total_similarity_score)
     return total_similarity_score
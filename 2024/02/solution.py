@@ -6,7 +6,7 @@
 from typing import List
 from my_utils import setup_logging
 
-logger = setup_logging(log_level="INFO")
+logger = setup_logging()
 
 
 def parse_input(lines: List[str]) -> List[List[int]]:
@@ -20,7 +20,7 @@ def parse_input(lines: List[str]) -> List[List[int]]:
         list of list of int: Parsed levels from the reports.
     """
     data = [list(map(int, line.split())) for line in lines]
-    logger.debug(f"Parsed input: {data}")
+    logger.debug("Parsed input: {}", data)
     return data
 
 
@@ -43,9 +43,13 @@ def is_safe(report: List[int]) -> bool:
         report[i] > report[i + 1] and 1 <= report[i] - report[i + 1] <= 3
         for i in range(len(report) - 1)
     )
-    logger.debug(
-        f"Report: {report}, increasing: {increasing}, decreasing: {decreasing}"
-    )
+    if logger.debug_enabled:
+        logger.debug(
+            "Report: {}, increasing: {}, decreasing: {}",
+            report,
+            increasing,
+            decreasing,
+        )
     return increasing or decreasing
 
 
@@ -61,17 +65,19 @@ def is_safe_with_dampener(report: List[int]) -> bool:
         bool: True if the report is safe, False otherwise.
     """
     if is_safe(report):
-        logger.debug(f"Report: {report} is safe without dampener")
+        logger.debug("Report: {} is safe without dampener", report)
         return True
 
     for i in range(len(report)):
         modified_report = report[:i] + report[i + 1 :]
         if is_safe(modified_report):
             logger.debug(
-                f"Report: {report} is safe with dampener by removing level {report[i]}"
+                "Report: {} is safe with dampener by removing level {}",
+                report,
+                report[i],
             )
             return True
-    logger.debug(f"Report: {report} is not safe with dampener")
+    logger.debug("Report: {} is not safe with dampener", report)
     return False
 
 
@@ -86,7 +92,7 @@ def part1(data: List[List[int]]) -> int:
         int: The number of safe reports.
     """
     safe_reports = sum(1 for report in data if is_safe(report))
-    logger.debug(f"Number of safe reports: {safe_reports}")
+    logger.debug("Number of safe reports: {}", safe_reports)
     return safe_reports
 
 
@@ -104,6 +110,7 @@ def part2(data: List[List[int]]) -> int:
         1 for report in data if is_safe_with_dampener(report)
     )
     logger.debug(
-        f"Number of safe reports with the Problem Dampener: {safe_reports_with_dampener}"
+        "Number of safe reports with the Problem Dampener: {}",
+        safe_reports_with_dampener,
     )
     return safe_reports_with_dampener
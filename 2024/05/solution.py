@@ -4,9 +4,9 @@
 ## day 05
 
 from typing import List, Tuple, Dict, Set
-from my_utils import setup_logging
+from my_utils import setup_logging, topsort
 
-logger = setup_logging(log_level="DEBUG")
+logger = setup_logging()
 
 
 def parse_input(lines: List[str]) -> Tuple[Dict[int, Set[int]], List[List[int]]]:
@@ -28,8 +28,8 @@ def parse_input(lines: List[str]) -> Tuple[Dict[int, Set[int]], List[List[int]]]
         else:
             updates.append([int(x) for x in line.split(",")])
 
-    logger.debug(f"Parsed rules: {rules}")
-    logger.debug(f"Parsed updates: {updates}")
+    logger.debug("Parsed rules: {}", rules)
+    logger.debug("Parsed updates: {}", updates)
     return rules, updates
 
 
@@ -37,37 +37,12 @@ def process(nums: List[int], rules: Dict[int, Set[int]]) -> int:
     read: Set[int] = set()
     for num in nums:
         if num in rules and len(rules[num].intersection(read)) > 0:
-            logger.debug(f"Invalid sequence found in {nums}")
+            logger.debug("Invalid sequence found in {}", nums)
             return 0
         read.add(num)
     return nums[len(nums) // 2]
 
 
-def find_invalid(nums: List[int], index: int, rules: Dict[int, Set[int]]) -> int:
-    value = nums[index]
-    if value not in rules:
-        return -1
-    for j in range(index):
-        if nums[j] in rules[value]:
-            return j
-    return -1
-
-
-def my_sort(nums: List[int], rules: Dict[int, Set[int]], step: int = 0) -> List[int]:
-    invalid_index = -1
-    for i in range(len(nums)):
-        invalid_index = find_invalid(nums, i, rules)
-        if invalid_index != -1:
-            nums = (
-                nums[:invalid_index] + [nums[i]] + nums[invalid_index:i] + nums[i + 1 :]
-            )
-            logger.debug(f"Step {step}: Reordered nums to {nums}")
-            break
-    if invalid_index == -1:
-        return nums
-    return my_sort(nums, rules, step + 1)
-
-
 def part1(rules: Dict[int, Set[int]], updates: List[List[int]]) -> int:
     total_sum = 0
     for update in updates:
@@ -80,8 +55,9 @@ def part2(rules: Dict[int, Set[int]], updates: List[List[int]]) -> int:
     for update in updates:
         points = process(update, rules)
         if points != 0:
-            logger.debug(f"Valid sequence found in {update}")
+            logger.debug("Valid sequence found in {}", update)
             continue
-        update = my_sort(update, rules)
+        update = topsort(rules, nodes=update)
+        logger.debug("Reordered update to {}", update)
         total_sum += process(update, rules)
     return total_sum
@@ -3,34 +3,49 @@
 ## https://adventofcode.com/2024
 ## day 06
 
-from typing import List, Tuple, Dict, Set
-from my_utils import setup_logging
+from typing import List, Tuple
+from my_utils import setup_logging, Grid
 
-logger = setup_logging(log_level="DEBUG")
+logger = setup_logging()
 
+OBSTACLE = ord("#")
 
-def parse_input(lines: List[str]) -> Dict[complex, str]:
-    return {i + j * 1j: c for i, r in enumerate(lines) for j, c in enumerate(r.strip())}
 
+def parse_input(lines: List[str]) -> Grid:
+    return Grid(lines)
 
-def walk(grid: Dict[complex, str], start: complex) -> Tuple[Set[complex], bool]:
-    position, direction, seen = start, -1, set()
-    while position in grid and (position, direction) not in seen:
-        seen |= {(position, direction)}
-        if grid.get(position + direction) == "#":
-            direction *= -1j
+
+def walk(grid: Grid, start: int) -> Tuple[bytearray, bool]:
+    # One bit per heading (N, E, S, W) for every cell we have stood on.
+    cells, border, offsets = grid.cells, grid.border, grid.offsets_4
+    seen = bytearray(len(cells))
+    position, direction = start, 0
+    while cells[position] != border and not seen[position] & (1 << direction):
+        seen[position] |= 1 << direction
+        if cells[position + offsets[direction]] == OBSTACLE:
+            direction = (direction + 1) % 4
         else:
-            position += direction
-    return {p for p, _ in seen}, (position, direction) in seen
+            position += offsets[direction]
+    looped = cells[position] != border
+    return seen, looped
+
+
+def visited(seen: bytearray) -> List[int]:
+    return [i for i, bits in enumerate(seen) if bits]
 
 
-def part1(data: Dict[complex, str]) -> int:
-    start = min([p for p in data if data[p] == "^"])
-    path = walk(data, start)[0]
+def part1(data: Grid) -> int:
+    start = data.find("^")
+    path = visited(walk(data, start)[0])
     return len(path)
 
 
-def part2(data: Dict[complex, str]) -> int:
-    start = min(p for p in data if data[p] == "^")
-    path = walk(data, start)[0]
-    return sum(walk(data | {o: "#"}, start)[1] for o in path)
+def part2(data: Grid) -> int:
+    start = data.find("^")
+    path = visited(walk(data, start)[0])
+    loops = 0
+    for o in path:
+        previous, data.cells[o] = data.cells[o], OBSTACLE
+        loops += walk(data, start)[1]
+        data.cells[o] = previous
+    return loops
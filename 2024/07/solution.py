@@ -5,17 +5,15 @@
 
 import itertools
 
-from my_utils import setup_logging
+from my_utils import parse_nums, setup_logging
 
-logger = setup_logging(log_level="DEBUG")
+logger = setup_logging()
 
 
 def parse_input(lines):
     parsed_data = []
     for line in lines:
-        test_value, numbers = line.split(":")
-        test_value = int(test_value.strip())
-        numbers = list(map(int, numbers.strip().split()))
+        test_value, *numbers = parse_nums(line)
         parsed_data.append((test_value, numbers))
     return parsed_data
 
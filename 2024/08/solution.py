@@ -7,7 +7,7 @@ from my_utils import setup_logging, Point
 from itertools import permutations
 from collections import defaultdict
 
-logger = setup_logging(log_level="DEBUG")
+logger = setup_logging()
 
 
 def parse_input(lines):
@@ -28,16 +28,21 @@ def solve(board, antennae, part2=False):
 
     for freq, locs in antennae.items():
         for a, b in permutations(locs, 2):
-            for i in range(len(board)):
-                antinode = b + (b - a) * i
+            step = b - a
+            antinode = b
+            i = 0
+            # Antinodes march away from the pair, so stop once off the board.
+            while antinode in board:
                 part_2_antinodes.add(antinode)
                 if i == 1:
                     part_1_antinodes.add(antinode)
+                antinode += step
+                i += 1
 
     if part2:
-        return len(part_2_antinodes & set(board))
+        return len(part_2_antinodes)
     else:
-        return len(part_1_antinodes & set(board))
+        return len(part_1_antinodes)
 
 
 def part1(board, antennae):
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Startup cost of importing my_utils, measured with ``python -X importtime``.
+
+    python benchmarks/import_time.py [--repeat N] [--top N]
+
+Each scenario runs in a fresh interpreter. The import time left after
+subtracting an empty interpreter's is compared against the scenario's budget.
+The script exits non-zero if any scenario goes over.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (statement, budget in ms) covering what the solutions typically import.
+# loguru and numpy dominate the two big budgets and are out of our hands.
+SCENARIOS = {
+    "import my_utils": ("import my_utils", 5),
+    "setup_logging": ("from my_utils import setup_logging", 200),
+    "Point": ("from my_utils import Point", 15),
+    "load_input": ("from my_utils import load_input", 10),
+    "lcm": ("from my_utils import lcm", 20),
+    "Grid, shortest_path": ("from my_utils import Grid, shortest_path", 20),
+    "parse_nums": ("from my_utils import parse_nums", 25),
+    "extract_ints (numpy)": (
+        "from my_utils import extract_ints; extract_ints('1 2')",
+        300,
+    ),
+}
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(statement: str) -> dict:
+    """Self time in microseconds of every module imported by ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for match in LINE.finditer(result.stderr):
+        times[match.group(4)] = int(match.group(1))
+    return times
+
+
+def best_of(statement: str, repeat: int) -> dict:
+    """Per-module minimum over ``repeat`` runs, which filters out noise."""
+    runs = [import_times(statement) for _ in range(repeat)]
+    return {name: min(run.get(name, 0) for run in runs) for name in runs[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=0, help="Show the N slowest modules per scenario"
+    )
+    args = parser.parse_args()
+
+    baseline = best_of("pass", args.repeat)
+    over = 0
+    for name, (statement, budget_ms) in SCENARIOS.items():
+        times = best_of(statement, args.repeat)
+        extra = {mod: us for mod, us in times.items() if mod not in baseline}
+        total_ms = sum(extra.values()) / 1000
+        status = "ok" if total_ms <= budget_ms else "OVER"
+        over += status == "OVER"
+        print(
+            f"{name:<22} {total_ms:7.1f} ms  (budget {budget_ms:>3} ms)  "
+            f"{len(extra):3} modules  {status}"
+        )
+        for mod, us in sorted(extra.items(), key=lambda kv: -kv[1])[: args.top]:
+            print(f"    {us / 1000:7.1f} ms  {mod}")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Cost of a debug call while logging is at INFO.
+
+    python benchmarks/logging_overhead.py [--number N]
+
+Compares an empty loop with the old ``logger.debug(f"...")`` style, the
+``LazyLogger`` facade with deferred arguments, and a ``debug_enabled`` guard.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger as loguru_logger  # noqa: E402
+from my_utils import setup_logging  # noqa: E402
+
+CASES = {
+    "no logging": "x += 1",
+    "loguru f-string": 'x += 1; loguru_logger.debug(f"Moving head to {x}, {y}")',
+    "facade deferred args": 'x += 1; log.debug("Moving head to {}, {}", x, y)',
+    "facade callable": 'x += 1; log.debug(lambda: f"Moving head to {x}, {y}")',
+    "debug_enabled guard": (
+        'x += 1\nif debug: log.debug("Moving head to {}, {}", x, y)'
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    log = setup_logging("INFO")
+    env = {
+        "log": log,
+        "loguru_logger": loguru_logger,
+        "debug": log.debug_enabled,
+    }
+    baseline = None
+    for name, stmt in CASES.items():
+        best = min(
+            timeit.repeat(
+                stmt, "x, y = 0, (12, 34)", globals=env, number=args.number, repeat=5
+            )
+        )
+        ns = best / args.number * 1e9
+        baseline = ns if baseline is None else baseline
+        print(f"{name:<22} {ns:8.1f} ns/call  (+{ns - baseline:.1f} ns)")
+
+
+if __name__ == "__main__":
+    main()
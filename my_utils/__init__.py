@@ -0,0 +1,131 @@
+"""
+Shared helpers for the Advent of Code solutions.
+
+Everything is importable straight from ``my_utils``, but the submodules are
+only loaded the first time one of their names is used (PEP 562), so a day
+that just wants ``setup_logging`` or ``Point`` doesn't pay for numpy, regexes
+or the runner. ``python benchmarks/import_time.py`` checks the startup cost.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "cache": ("CacheInfo", "memoize"),
+    "cli": ("parse_args",),
+    "cycles": ("find_cycle", "fast_forward"),
+    "geometry": (
+        "HEX_DIRS",
+        "hex_distance",
+        "polygon_perimeter",
+        "polygon_area",
+        "MOVES",
+        "LatticePolygon",
+        "shoelace",
+        "trace",
+        "shoelace_arrays",
+        "trace_arrays",
+        "Point",
+        "PointArray",
+        "N",
+        "NE",
+        "E",
+        "SE",
+        "S",
+        "SW",
+        "W",
+        "NW",
+        "DIRS_4",
+        "DIRS",
+        "DIRS_8",
+    ),
+    "graph": (
+        "CycleError",
+        "topsort",
+        "SearchResult",
+        "shortest_path",
+        "BucketQueue",
+        "resolve_mapping",
+        "UnionFind",
+    ),
+    "grid": (
+        "new_table",
+        "transposed",
+        "rotated",
+        "firsts",
+        "lasts",
+        "min_max_xy",
+        "print_grid",
+        "Grid",
+    ),
+    "hashing": ("md5", "sha256", "HASH", "knot_hash"),
+    "inputs": ("CACHE_DIR", "PuzzleInput", "load_input"),
+    "intervals": ("IntervalSet", "PiecewiseOffsetMap"),
+    "logs": (
+        "LOG_LEVELS",
+        "LOG_FORMAT",
+        "DEBUG_ENABLED",
+        "LazyLogger",
+        "log",
+        "setup_logging",
+    ),
+    "number_theory": (
+        "gcd",
+        "lcm",
+        "egcd",
+        "modinv",
+        "crt_merge",
+        "crt",
+        "linear_congruence",
+        "solve_congruences",
+        "Sieve",
+        "primes",
+        "is_prime",
+        "prime_factors",
+        "factors",
+    ),
+    "parsing": (
+        "LETTERS",
+        "VOWELS",
+        "CONSONANTS",
+        "compiled",
+        "parse_line",
+        "parse_nums",
+        "extract_ints",
+        "mul",
+        "chunks",
+        "parts",
+        "all_unique",
+    ),
+    "runner": (
+        "PHASES",
+        "collapse_stats",
+        "write_profile",
+        "load_solution",
+        "run_solution",
+        "format_report",
+        "find_solutions",
+        "run_all",
+        "format_run_all",
+    ),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+# Reassigned by setup_logging, so always read through from the submodule.
+_LIVE = {"DEBUG_ENABLED"}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        if name in _EXPORTS:
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    if name not in _LIVE:
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_OF) | set(_EXPORTS))
@@ -0,0 +1,33 @@
+"""``python -m my_utils run <year> <day>`` and ``python -m my_utils run-all``."""
+
+import json
+import time
+
+from .cli import parse_args
+from .logs import setup_logging
+from .runner import format_report, format_run_all, run_all, run_solution
+
+if __name__ == "__main__":
+    args = parse_args()
+    logger = setup_logging("DEBUG" if args.debug else "INFO")
+    if args.command == "run":
+        report = run_solution(
+            args.year, args.day, args.example, args.repeat, args.profile, args.top
+        )
+        if args.json:
+            print(json.dumps(report, indent=2, default=str))
+        else:
+            print(format_report(report))
+            for name, phase in report["phases"].items():
+                if "profile" in phase:
+                    print(f"\n== {name}: {phase['profile']}.{{prof,collapsed}}")
+                    print(phase["profile_summary"].strip("\n"))
+    elif args.command == "run-all":
+        start = time.perf_counter()
+        results = run_all(
+            args.years, args.example, args.jobs, args.timeout, args.memory
+        )
+        if args.json:
+            print(json.dumps(results, indent=2, default=str))
+        else:
+            print(format_run_all(results, time.perf_counter() - start))
@@ -0,0 +1,26 @@
+"""Deferred imports for heavy optional dependencies."""
+
+import importlib
+
+
+class LazyModule:
+    """
+    Stands in for a module until one of its attributes is first used.
+
+    The real module's namespace is then copied onto the proxy, so later
+    lookups such as ``np.int64`` are plain attribute hits.
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+np = LazyModule("numpy")
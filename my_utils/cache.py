@@ -0,0 +1,66 @@
+"""Memoisation with hit/miss statistics."""
+
+from collections import namedtuple
+from functools import lru_cache, partial, wraps
+
+# inspect.CO_GENERATOR; checking the flag directly keeps inspect out of the
+# import graph of everything that uses @memoize.
+_CO_GENERATOR = 0x20
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+
+
+def memoize(f=None, *, maxsize=None, typed=False):
+    """
+    Memoization decorator keyed on the (hashable) call arguments.
+
+    Use bare as @memoize, or as @memoize(maxsize=N) to keep only the N most
+    recently used results. With typed=True, 1 and 1.0 are cached separately.
+    Unhashable arguments raise TypeError, as do generator functions, whose
+    results could only ever be consumed once.
+
+    This is functools.lru_cache underneath, so hits never leave C. The
+    wrapped function has cache_info() (hits, misses, evictions, maxsize,
+    currsize) and cache_clear().
+    """
+    if f is None:
+        return partial(memoize, maxsize=maxsize, typed=typed)
+    if getattr(getattr(f, "__code__", None), "co_flags", 0) & _CO_GENERATOR:
+        raise TypeError("refusing to memoize generator function %s" % f.__name__)
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+
+    # lru_cache counts a miss even when the call raises and nothing is stored.
+    # Evictions are misses that were stored and are gone again, so a bounded
+    # cache counts the failed calls; an unbounded one never evicts and calls
+    # `f` directly.
+    failed = 0
+    if maxsize is None:
+        call = f
+    else:
+
+        @wraps(f)
+        def call(*args, **kwargs):
+            nonlocal failed
+            try:
+                return f(*args, **kwargs)
+            except BaseException:
+                failed += 1
+                raise
+
+    _mem_fn = lru_cache(maxsize=maxsize, typed=typed)(call)
+    lru_info, lru_clear = _mem_fn.cache_info, _mem_fn.cache_clear
+
+    def cache_info():
+        info = lru_info()
+        evictions = info.misses - failed - info.currsize if maxsize else 0
+        return CacheInfo(info.hits, info.misses, evictions, maxsize, info.currsize)
+
+    def cache_clear():
+        nonlocal failed
+        lru_clear()
+        failed = 0
+
+    _mem_fn.cache_info = cache_info
+    _mem_fn.cache_clear = cache_clear
+    return _mem_fn
@@ -0,0 +1,111 @@
+"""Command line arguments shared by the solutions and the runner."""
+
+import argparse
+import os
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parses debug and test arguments, plus the optional ``run`` subcommand.
+
+    ``python -m my_utils run 2023 16 --repeat 5`` imports ``2023/16/solution.py``
+    and times its ``parse_input``, ``part1`` and ``part2`` phases.
+
+    Args:
+        argv (list, optional): Arguments to parse, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Parse command line arguments.")
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        default=False,
+        help="Enable debug logging",
+    )
+    parser.add_argument(
+        "--test",
+        action="store_true",
+        default=False,
+        help="Run tests",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    run = subparsers.add_parser("run", help="Run one day's solution with timings")
+    run.add_argument("year", type=int, help="Puzzle year, e.g. 2023")
+    run.add_argument("day", type=int, help="Puzzle day, 1-25")
+    run.add_argument(
+        "--example",
+        action="store_true",
+        default=False,
+        help="Use example_input.txt instead of input.txt",
+    )
+    run.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of timed runs, reports min and median",
+    )
+    run.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="Print the report as JSON",
+    )
+    run.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DIR",
+        help="Profile each phase and write collapsed stacks to DIR "
+        "(default: the day's .aoc_cache/profile)",
+    )
+    run.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Functions to list per phase when profiling",
+    )
+    run_all = subparsers.add_parser(
+        "run-all", help="Run every day in parallel and tabulate the results"
+    )
+    run_all.add_argument(
+        "years", type=int, nargs="*", help="Only run these years (default: all)"
+    )
+    run_all.add_argument(
+        "--example",
+        action="store_true",
+        default=False,
+        help="Use example_input.txt instead of input.txt",
+    )
+    run_all.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    run_all.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="Seconds each day may run before it is abandoned",
+    )
+    run_all.add_argument(
+        "--memory",
+        type=int,
+        default=4096,
+        help="Address-space cap per worker in MiB, 0 for no limit",
+    )
+    run_all.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="Print the results as JSON",
+    )
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.command == "run-all" and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
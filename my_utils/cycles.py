@@ -0,0 +1,87 @@
+"""Cycle detection for iterated state machines."""
+
+
+def find_cycle(step, state, key=hash):
+    """
+    Brent's cycle detection over the sequence state, step(state), ...
+
+    Only two states are alive at any time, and states are compared through
+    their `key` fingerprints. `step` must not mutate its argument, since the
+    sequence is replayed from `state` to locate the cycle start.
+
+    Returns (mu, lam): the index where the cycle starts and its length.
+    """
+    power = lam = 1
+    tortoise = key(state)
+    hare_state = step(state)
+    hare = key(hare_state)
+    while tortoise != hare:
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare_state = step(hare_state)
+        hare = key(hare_state)
+        lam += 1
+
+    tortoise_state = hare_state = state
+    for _ in range(lam):
+        hare_state = step(hare_state)
+    mu = 0
+    while key(tortoise_state) != key(hare_state):
+        tortoise_state = step(tortoise_state)
+        hare_state = step(hare_state)
+        mu += 1
+    return mu, lam
+
+
+def fast_forward(step, state, n, key=hash, observe=None, extrapolate=False):
+    """
+    Applies `step` to `state` n times, skipping whole cycles.
+
+    Each visited state is remembered only by its `key` fingerprint (plus
+    observe(state) when given), so memory grows with the cycle length, not
+    with the size of a state. Once a fingerprint repeats, the remaining
+    full cycles are jumped over.
+
+    Arguments:
+        step: state -> next state. May mutate and return the same object.
+        key: fingerprint of a state. Defaults to hash(); pass something
+            cheaper or more compact for large states.
+        observe: state -> value. If given, the observed value for iteration
+            n is returned instead of the state itself, read straight from
+            the record without stepping any further.
+        extrapolate: the observed value grows by a fixed amount every
+            cycle (e.g. a height), rather than repeating.
+
+    Returns:
+        The state after n steps, or its observed value.
+    """
+    seen = {}
+    observed = []
+    i = 0
+    while i < n:
+        fingerprint = key(state)
+        if fingerprint in seen:
+            break
+        seen[fingerprint] = i
+        if observe is not None:
+            observed.append(observe(state))
+        state = step(state)
+        i += 1
+    else:
+        return state if observe is None else observe(state)
+
+    start = seen[fingerprint]
+    period = i - start
+    cycles, remainder = divmod(n - i, period)
+
+    if observe is None:
+        for _ in range(remainder):
+            state = step(state)
+        return state
+
+    value = observed[start + remainder]
+    if extrapolate:
+        value += (cycles + 1) * (observe(state) - observed[start])
+    return value
@@ -0,0 +1,486 @@
+"""Points, directions and polygon measures."""
+
+import math
+from collections import namedtuple
+from functools import total_ordering
+from itertools import chain
+
+from ._lazy import np
+
+HEX_DIRS = {
+    "N": (1, -1, 0),
+    "NE": (1, 0, -1),
+    "SE": (0, 1, -1),
+    "S": (-1, 1, 0),
+    "SW": (-1, 0, 1),
+    "NW": (0, -1, 1),
+}
+
+
+def hex_distance(x, y, z):
+    """Returns a given hex point's distance from the origin."""
+    return (abs(x) + abs(y) + abs(z)) // 2
+
+
+def polygon_perimeter(points):
+    """Given a set of bounding box points, returns the perimeter of the polygon."""
+    return sum(a.dist_manhattan(b) for a, b in zip(points, points[1:] + [points[0]]))
+
+
+def polygon_area(points):
+    """Given a set of integer bounding box points, returns the total area of the polygon."""
+    # Interior plus boundary lattice points, see LatticePolygon.
+    return shoelace(points).lattice_area
+
+
+# Letters accepted as a move direction by trace(), in Point's y-up convention.
+MOVES = {
+    "U": (0, 1),
+    "D": (0, -1),
+    "L": (-1, 0),
+    "R": (1, 0),
+    "N": (0, 1),
+    "S": (0, -1),
+    "W": (-1, 0),
+    "E": (1, 0),
+    "^": (0, 1),
+    "v": (0, -1),
+    "<": (-1, 0),
+    ">": (1, 0),
+}
+
+
+class LatticePolygon(namedtuple("LatticePolygon", "twice_area boundary")):
+    """
+    Exact measures of a simple polygon with integer vertices.
+
+    twice_area is the absolute shoelace sum, so it stays an exact int however
+    large the coordinates get, and boundary counts the lattice points on the
+    edges. Pick's theorem (A = I + B/2 - 1) gives the rest.
+    """
+
+    __slots__ = ()
+
+    @property
+    def area(self):
+        """The enclosed area; an int, or a Fraction for half-integer areas."""
+        if self.twice_area % 2 == 0:
+            return self.twice_area // 2
+        from fractions import Fraction
+
+        return Fraction(self.twice_area, 2)
+
+    @property
+    def interior(self):
+        """Lattice points strictly inside the polygon."""
+        return (self.twice_area - self.boundary + 2) // 2
+
+    @property
+    def lattice_area(self):
+        """Lattice points inside or on the polygon, i.e. cells a trench encloses."""
+        return self.interior + self.boundary
+
+
+def shoelace(vertices):
+    """
+    Measures the polygon through `vertices` in a single pass.
+
+    Accepts any iterable of Points or (x, y) pairs, including generators, and
+    closes the polygon back to the first vertex.
+
+    Returns:
+        LatticePolygon: Exact twice-area and boundary point count.
+    """
+    it = iter(vertices)
+    first = next(it, None)
+    if first is None:
+        return LatticePolygon(0, 0)
+    x0, y0 = first
+    px, py = x0, y0
+    twice = boundary = 0
+    for x, y in chain(it, (first,)):
+        twice += px * y - x * py
+        boundary += math.gcd(x - px, y - py)
+        px, py = x, y
+    return LatticePolygon(abs(twice), boundary)
+
+
+def trace(moves, start=(0, 0)):
+    """
+    Measures the polygon traced by `moves`, an iterable of (direction, length).
+
+    A direction is a letter from MOVES or a (dx, dy) step such as a Point.
+    Vertices are never stored, so the moves can be streamed straight from
+    the input; a path that doesn't end at `start` is closed implicitly.
+
+    Returns:
+        LatticePolygon: Exact twice-area and boundary point count.
+    """
+    x, y = x0, y0 = start
+    twice = boundary = 0
+    for direction, length in moves:
+        dx, dy = MOVES[direction] if isinstance(direction, str) else direction
+        # Cross product of (x, y) and (x + dx*length, y + dy*length).
+        twice += (x * dy - y * dx) * length
+        boundary += math.gcd(dx, dy) * length
+        x += dx * length
+        y += dy * length
+    twice += x * y0 - x0 * y
+    boundary += math.gcd(x0 - x, y0 - y)
+    return LatticePolygon(abs(twice), boundary)
+
+
+def shoelace_arrays(xs, ys):
+    """
+    NumPy version of shoelace() for polygons with very many vertices.
+
+    The sums run in int64 after moving the first vertex to the origin. If the
+    coordinates are large enough that this could overflow, the arrays are
+    measured with Python ints instead, so the result is always exact.
+
+    Args:
+        xs, ys: Vertex coordinates, e.g. PointArray.xs and PointArray.ys.
+
+    Returns:
+        LatticePolygon: Exact twice-area and boundary point count.
+    """
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    n = len(xs)
+    if n == 0:
+        return LatticePolygon(0, 0)
+    xs = xs - xs[0]
+    ys = ys - ys[0]
+    reach = max(int(np.abs(xs).max()), int(np.abs(ys).max()))
+    # Each cross term is at most 2 * reach**2 and there are n of them.
+    if 2 * reach * reach * n >= 2**63:
+        return shoelace(zip(xs.tolist(), ys.tolist()))
+    nx = np.roll(xs, -1)
+    ny = np.roll(ys, -1)
+    twice = int(np.dot(xs, ny) - np.dot(nx, ys))
+    boundary = int(np.gcd(nx - xs, ny - ys).sum())
+    return LatticePolygon(abs(twice), boundary)
+
+
+def trace_arrays(directions, lengths, start=(0, 0)):
+    """
+    NumPy version of trace(): `directions` is an (n, 2) array of unit steps
+    and `lengths` the n move lengths. The vertices must fit in int64.
+
+    Returns:
+        LatticePolygon: Exact twice-area and boundary point count.
+    """
+    steps = np.asarray(directions, dtype=np.int64) * np.asarray(
+        lengths, dtype=np.int64
+    ).reshape(-1, 1)
+    xs = np.concatenate(([start[0]], start[0] + np.cumsum(steps[:, 0])))
+    ys = np.concatenate(([start[1]], start[1] + np.cumsum(steps[:, 1])))
+    # A closed path repeats the start as its last vertex, which adds a
+    # zero-length edge and nothing else.
+    return shoelace_arrays(xs, ys)
+
+
+@total_ordering
+class Point:
+    """
+    Simple, immutable 2-dimensional point.
+
+    The hash is computed once on construction, and points order by their
+    squared length (ties broken by x, then y) so comparisons stay in integers.
+    """
+
+    __slots__ = ("x", "y", "_hash")
+
+    def __init__(self, x, y):
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_hash(self, hash((x, y)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Point is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Point is immutable")
+
+    def __reduce__(self):
+        return Point, (self.x, self.y)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __add__(self, other):
+        return Point(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return Point(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, n):
+        return Point(self.x * n, self.y * n)
+
+    def __floordiv__(self, n):
+        return Point(self.x // n, self.y // n)
+
+    def __neg__(self):
+        return Point(-self.x, -self.y)
+
+    def __eq__(self, other):
+        if other.__class__ is not Point:
+            return False
+        return self.x == other.x and self.y == other.y
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        a = self.x * self.x + self.y * self.y
+        b = other.x * other.x + other.y * other.y
+        if a != b:
+            return a < b
+        return (self.x, self.y) < (other.x, other.y)
+
+    def __invert__(self):
+        return Point(-self.y, -self.x)
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __str__(self):
+        return "({}, {})".format(self.x, self.y)
+
+    def __repr__(self):
+        return "Point({}, {})".format(self.x, self.y)
+
+    def __hash__(self):
+        return self._hash
+
+    def dist(self, other):
+        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+
+    def dist_manhattan(self, other):
+        return abs(self.x - other.x) + abs(self.y - other.y)
+
+    def dist_chess(self, other):
+        return max(abs(self.x - other.x), abs(self.y - other.y))
+
+    def dist_chebyshev(self, other):
+        return self.dist_chess(other)
+
+    def angle(self, to=None):
+        if to is None:
+            return math.atan2(self.y, self.x)
+        return math.atan2(self.y - to.y, self.x - to.x)
+
+    def rotate(self, turns):
+        """Returns the rotation of the Point around (0, 0) `turn` times clockwise."""
+        turns = turns % 4
+
+        if turns == 1:
+            return Point(self.y, -self.x)
+        elif turns == 2:
+            return Point(-self.x, -self.y)
+        elif turns == 3:
+            return Point(-self.y, self.x)
+        else:
+            return self
+
+    @property
+    def manhattan(self):
+        return abs(self.x) + abs(self.y)
+
+    @property
+    def chess(self):
+        return max(abs(self.x), abs(self.y))
+
+    @property
+    def chebyshev(self):
+        return self.chess
+
+    @property
+    def length(self):
+        return math.sqrt(self.x**2 + self.y**2)
+
+    def neighbours_4(self):
+        """Returns the 4 orthogonal neighbours as a tuple."""
+        x, y = self.x, self.y
+        return tuple(Point(x + dx, y + dy) for dx, dy in _OFFSETS_4)
+
+    def neighbors_4(self):
+        return self.neighbours_4()
+
+    def neighbours(self):
+        return self.neighbours_4()
+
+    def neighbors(self):
+        return self.neighbours()
+
+    def neighbours_8(self):
+        """Returns the 8 surrounding neighbours as a tuple."""
+        x, y = self.x, self.y
+        return tuple(Point(x + dx, y + dy) for dx, dy in _OFFSETS_8)
+
+    def neighbors_8(self):
+        return self.neighbours_8()
+
+
+# Slot setters bypass Point.__setattr__, which is what keeps Point immutable.
+_set_x = Point.x.__set__
+_set_y = Point.y.__set__
+_set_hash = Point._hash.__set__
+_OFFSETS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_OFFSETS_8 = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+
+class PointArray:
+    """
+    Many points stored as two int64 NumPy arrays, for bulk arithmetic.
+
+    Arithmetic accepts a Point (broadcast to every element), another
+    PointArray of the same length, or a scalar for multiplication.
+    """
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs, ys):
+        self.xs = np.asarray(xs, dtype=np.int64)
+        self.ys = np.asarray(ys, dtype=np.int64)
+        if self.xs.shape != self.ys.shape:
+            raise ValueError("xs and ys must have the same shape")
+
+    @classmethod
+    def from_points(cls, points):
+        """Builds a PointArray from an iterable of Points or (x, y) tuples."""
+        coords = np.array(
+            [(p[0], p[1]) if type(p) is tuple else (p.x, p.y) for p in points],
+            dtype=np.int64,
+        )
+        if len(coords) == 0:
+            return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        return cls(coords[:, 0], coords[:, 1])
+
+    def to_points(self):
+        return [Point(x, y) for x, y in zip(self.xs.tolist(), self.ys.tolist())]
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __iter__(self):
+        return iter(self.to_points())
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Point(int(self.xs[index]), int(self.ys[index]))
+        return PointArray(self.xs[index], self.ys[index])
+
+    def __repr__(self):
+        return "PointArray({})".format(self.to_points())
+
+    @staticmethod
+    def _coords(other):
+        if isinstance(other, PointArray):
+            return other.xs, other.ys
+        return other.x, other.y
+
+    def __add__(self, other):
+        ox, oy = self._coords(other)
+        return PointArray(self.xs + ox, self.ys + oy)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        ox, oy = self._coords(other)
+        return PointArray(self.xs - ox, self.ys - oy)
+
+    def __mul__(self, n):
+        return PointArray(self.xs * n, self.ys * n)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return PointArray(-self.xs, -self.ys)
+
+    def __eq__(self, other):
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return np.array_equal(self.xs, other.xs) and np.array_equal(self.ys, other.ys)
+
+    __hash__ = None
+
+    def dist_manhattan(self, other):
+        ox, oy = self._coords(other)
+        return np.abs(self.xs - ox) + np.abs(self.ys - oy)
+
+    def dist_chess(self, other):
+        ox, oy = self._coords(other)
+        return np.maximum(np.abs(self.xs - ox), np.abs(self.ys - oy))
+
+    def dist_chebyshev(self, other):
+        return self.dist_chess(other)
+
+    @property
+    def manhattan(self):
+        return np.abs(self.xs) + np.abs(self.ys)
+
+    def _expand(self, offsets):
+        dx = np.array([d[0] for d in offsets], dtype=np.int64)
+        dy = np.array([d[1] for d in offsets], dtype=np.int64)
+        return PointArray(
+            (self.xs[:, None] + dx).ravel(), (self.ys[:, None] + dy).ravel()
+        )
+
+    def neighbours_4(self):
+        """Returns every point's 4 neighbours, grouped per point (len * 4)."""
+        return self._expand(_OFFSETS_4)
+
+    def neighbors_4(self):
+        return self.neighbours_4()
+
+    def neighbours_8(self):
+        """Returns every point's 8 neighbours, grouped per point (len * 8)."""
+        return self._expand(_OFFSETS_8)
+
+    def neighbors_8(self):
+        return self.neighbours_8()
+
+    def in_bounds(self, min_x, max_x, min_y, max_y):
+        """Boolean mask of points inside the inclusive bounding box."""
+        return (
+            (self.xs >= min_x)
+            & (self.xs <= max_x)
+            & (self.ys >= min_y)
+            & (self.ys <= max_y)
+        )
+
+    def unique(self):
+        """Returns the distinct points, sorted by (x, y)."""
+        pairs = np.unique(np.stack([self.xs, self.ys], axis=1), axis=0)
+        return PointArray(pairs[:, 0], pairs[:, 1])
+
+
+N = Point(0, 1)
+NE = Point(1, 1)
+E = Point(1, 0)
+SE = Point(1, -1)
+S = Point(0, -1)
+SW = Point(-1, -1)
+W = Point(-1, 0)
+NW = Point(-1, 1)
+DIRS_4 = DIRS = [
+    Point(0, 1),  # north
+    Point(1, 0),  # east
+    Point(0, -1),  # south
+    Point(-1, 0),  # west
+]
+DIRS_8 = [
+    Point(0, 1),  # N
+    Point(1, 1),  # NE
+    Point(1, 0),  # E
+    Point(1, -1),  # SE
+    Point(0, -1),  # S
+    Point(-1, -1),  # SW
+    Point(-1, 0),  # W
+    Point(-1, 1),  # NW
+]
@@ -0,0 +1,434 @@
+"""Topological sort, shortest paths, priority queues and union-find."""
+
+from array import array
+from collections import deque
+from functools import partial
+from heapq import heapify, heappop, heappush
+
+
+class CycleError(ValueError):
+    """Raised by topsort() when the graph has a cycle. `cycle` lists one."""
+
+    def __init__(self, cycle):
+        super().__init__("graph contains a cycle: %s" % " -> ".join(map(str, cycle)))
+        self.cycle = cycle
+
+
+def topsort(graph, tiebreak=None, nodes=None):
+    """
+    Given a graph where graph[x] is an iterable of edges of directed
+    edges originating from x, returns a topologically sorted list of
+    nodes in the graph.
+
+    Uses Kahn's algorithm. Whenever several nodes are ready, the one with
+    the smallest `tiebreak(node)` comes first (the node itself if no
+    tiebreak is given). If `nodes` is given, only those nodes are ordered,
+    using just the edges between them, so one precomputed rule graph can
+    order many different subsets.
+
+    Raises CycleError if the (sub)graph is not a DAG.
+    """
+    if tiebreak is None:
+        tiebreak = lambda x: x  # NOQA
+
+    if nodes is None:
+        order = list(graph)
+        members = set(order)
+        for node in list(order):
+            for n in graph[node]:
+                if n not in members:
+                    members.add(n)
+                    order.append(n)
+    else:
+        order = list(dict.fromkeys(nodes))
+        members = set(order)
+
+    successors = {
+        node: [n for n in graph.get(node, ()) if n in members] for node in order
+    }
+    indegree = dict.fromkeys(order, 0)
+    for node in order:
+        for n in successors[node]:
+            indegree[n] += 1
+
+    # The sequence number keeps the heap from comparing nodes on ties.
+    heap = [(tiebreak(n), i, n) for i, n in enumerate(order) if not indegree[n]]
+    heapify(heap)
+    seq = len(order)
+    result = []
+    while heap:
+        _, _, node = heappop(heap)
+        result.append(node)
+        for n in successors[node]:
+            indegree[n] -= 1
+            if not indegree[n]:
+                heappush(heap, (tiebreak(n), seq, n))
+                seq += 1
+
+    if len(result) < len(order):
+        raise CycleError(_find_cycle(successors, indegree))
+    return result
+
+
+def _find_cycle(successors, indegree):
+    """Walks predecessors among the nodes Kahn's algorithm could not place."""
+    remaining = {n for n, d in indegree.items() if d}
+    predecessor = {}
+    for node in remaining:
+        for n in successors[node]:
+            if n in remaining:
+                predecessor[n] = node
+    node = next(iter(remaining))
+    path = {}
+    while node not in path:
+        path[node] = len(path)
+        node = predecessor[node]
+    cycle = list(path)[path[node] :]
+    cycle.reverse()
+    return cycle + [cycle[0]]
+
+
+class SearchResult:
+    """
+    Outcome of shortest_path(). States are interned to ints during the
+    search; this maps them back.
+
+    Attributes:
+        goal: the goal state that ended the search, or None.
+        cost: the distance to `goal`, or None if no goal was reached.
+    """
+
+    __slots__ = ("goal", "cost", "_ids", "_states", "_dist", "_parent")
+
+    def __init__(self, goal, cost, ids, states, dist, parent):
+        self.goal = goal
+        self.cost = cost
+        self._ids = ids
+        self._states = states
+        self._dist = dist
+        self._parent = parent
+
+    def __bool__(self):
+        return self.goal is not None
+
+    def distance(self, state):
+        """Best known distance to `state`, or None if it was never reached."""
+        i = self._ids.get(state)
+        return None if i is None else self._dist[i]
+
+    def distances(self):
+        """Returns {state: distance} for every state the search reached."""
+        return dict(zip(self._states, self._dist))
+
+    def path(self, state=None):
+        """Returns the states from a start to `state` (default: the goal)."""
+        if state is None:
+            state = self.goal
+        i = self._ids.get(state)
+        if i is None:
+            return None
+        path = []
+        while i != -1:
+            path.append(self._states[i])
+            i = self._parent[i]
+        return path[::-1]
+
+
+def shortest_path(starts, neighbours, goal=None, heuristic=None, max_weight=None):
+    """
+    Single-engine shortest path search over arbitrary hashable states.
+
+    `neighbours(state)` yields (next_state, weight) pairs, where weight is
+    an integer >= 0. Distances are kept in array("q"), so a float weight
+    raises TypeError.
+    The search runs as a plain BFS while every edge it sees has weight 1,
+    switches to a 0-1 BFS once a zero-weight edge shows up, and to Dijkstra
+    as soon as any other weight appears. Passing `heuristic(state)` (which
+    must be consistent) makes it an A* search from the start.
+
+    Arguments:
+        starts: iterable of start states, all at distance 0.
+        neighbours: function yielding (state, weight) pairs.
+        goal: a predicate, or a state to compare against. The search stops
+            as soon as a goal state is settled. Without one, the whole
+            reachable graph is explored.
+        heuristic: optional lower bound on the remaining distance.
+        max_weight: if every edge weight is a small integer no larger than
+            this, Dijkstra runs on a BucketQueue instead of a binary heap.
+            Ignored for A*.
+
+    Returns:
+        SearchResult
+    """
+    if goal is not None and not callable(goal):
+        target = goal
+        goal = lambda state: state == target  # NOQA
+
+    ids = {}
+    states = []
+    dist = array("q")
+    parent = array("q")
+    done = bytearray()
+
+    def intern(state):
+        i = ids.get(state)
+        if i is None:
+            i = ids[state] = len(states)
+            states.append(state)
+            dist.append(-1)
+            parent.append(-1)
+            done.append(0)
+        return i
+
+    # Entries are (priority, id). A deque stays sorted by priority under
+    # unit/zero weights, so it can be handed to heapq as-is when needed.
+    queue = deque()
+    for state in starts:
+        i = intern(state)
+        if dist[i] != 0:
+            dist[i] = 0
+            queue.append((heuristic(state) if heuristic else 0, i))
+
+    # Once weights stop being 0/1, the deque is replaced by a priority queue.
+    heap = push = pop = None
+
+    def upgrade(entries):
+        nonlocal heap, push, pop
+        if max_weight is not None and heuristic is None:
+            heap = BucketQueue(max_weight, entries)
+            push, pop = heap.push, heap.pop
+        else:
+            heap = sorted(entries)
+            push, pop = partial(heappush, heap), partial(heappop, heap)
+
+    if heuristic is not None:
+        upgrade(queue)
+
+    while heap or (heap is None and queue):
+        if heap is None:
+            _, i = queue.popleft()
+        else:
+            _, i = pop()
+        if done[i]:
+            continue
+        done[i] = 1
+
+        state = states[i]
+        if goal is not None and goal(state):
+            return SearchResult(state, dist[i], ids, states, dist, parent)
+
+        d = dist[i]
+        for nxt, weight in neighbours(state):
+            j = intern(nxt)
+            nd = d + weight
+            if done[j] or (dist[j] != -1 and dist[j] <= nd):
+                continue
+            try:
+                dist[j] = nd
+            except TypeError:
+                raise TypeError(
+                    "edge weights must be integers, got %r" % (weight,)
+                ) from None
+            parent[j] = i
+            if heap is None and weight not in (0, 1):
+                upgrade(queue)
+                queue = None
+            if heap is not None:
+                push((nd + heuristic(nxt) if heuristic else nd, j))
+            elif weight:
+                queue.append((nd, j))
+            else:
+                queue.appendleft((nd, j))
+
+    return SearchResult(None, None, ids, states, dist, parent)
+
+
+class BucketQueue:
+    """
+    Monotone priority queue (Dial's algorithm) for small integer priorities.
+
+    Items are tuples whose first element is the integer priority, as with
+    heapq. Every pushed priority must lie within `max_weight` of the lowest
+    priority still queued, which always holds for Dijkstra with edge
+    weights in [0, max_weight]. Priorities map onto a circular array of
+    max_weight + 1 buckets, so push and pop are O(1) amortised.
+
+    Example:
+
+    q = BucketQueue(9)
+    q.push((3, "a"))
+    q.push((1, "b"))
+    q.pop()  # (1, "b")
+    """
+
+    __slots__ = ("max_weight", "_buckets", "_cursor", "_count")
+
+    def __init__(self, max_weight, items=()):
+        self.max_weight = max_weight
+        self._buckets = [[] for _ in range(max_weight + 1)]
+        self._cursor = 0
+        self._count = 0
+        for item in items:
+            self.push(item)
+
+    def __len__(self):
+        return self._count
+
+    def push(self, item):
+        priority = item[0]
+        if not self._count:
+            # Nothing is queued, so the window can move anywhere. Keep it
+            # where it is if the priority fits, so that lower priorities
+            # within max_weight can still follow.
+            if priority < self._cursor:
+                self._cursor = priority
+            elif priority > self._cursor + self.max_weight:
+                self._cursor = priority - self.max_weight
+        elif not self._cursor <= priority <= self._cursor + self.max_weight:
+            raise ValueError(
+                "priority %d outside [%d, %d]"
+                % (priority, self._cursor, self._cursor + self.max_weight)
+            )
+        self._buckets[priority % len(self._buckets)].append(item)
+        self._count += 1
+
+    def pop(self):
+        if not self._count:
+            raise IndexError("pop from empty BucketQueue")
+        buckets = self._buckets
+        size = len(buckets)
+        cursor = self._cursor
+        bucket = buckets[cursor % size]
+        while not bucket:
+            cursor += 1
+            bucket = buckets[cursor % size]
+        self._cursor = cursor
+        self._count -= 1
+        return bucket.pop()
+
+
+def resolve_mapping(candidates):
+    """
+    Given a dictionary `candidates` mapping keys to candidate values, returns
+    a dictionary where each `key` maps to a unique `value`. Hangs if intractable.
+
+    Example:
+
+    candidates = {
+        'a': [0, 1, 2],
+        'b': [0, 1],
+        'c': [0],
+    }
+
+    resolve_mapping(candidates) -> {'c': 0, 'b': 1, 'a': 2}
+    """
+    resolved = {}
+
+    # Ensure the mapping is key -> set(values).
+    candidates_map = {}
+    for k, v in candidates.items():
+        candidates_map[k] = set(v)
+
+    while len(resolved) < len(candidates_map):
+        for candidate in candidates_map:
+            if len(candidates_map[candidate]) == 1 and candidate not in resolved:
+                r = candidates_map[candidate].pop()
+                for c in candidates_map:
+                    candidates_map[c].discard(r)
+
+                resolved[candidate] = r
+                break
+
+    return resolved
+
+
+class UnionFind:
+    """
+    If this comes in handy, thank you mcpower!
+    https://www.reddit.com/r/adventofcode/comments/a9c61w/2018_day_25_solutions/eci5kaf/
+
+    Parents and component sizes live in array('i'); find() is iterative with
+    path halving and merges are by size, so long chains never recurse.
+    """
+
+    # n: int
+    # parents: array('i'), a root is its own parent
+    # sizes: array('i'), only meaningful at roots
+    # num_sets: int
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.parents = array("i", range(n))
+        self.sizes = array("i", [1]) * n
+        self.num_sets = n
+
+    def find(self, i: int) -> int:
+        parents = self.parents
+        while parents[i] != i:
+            parents[i] = i = parents[parents[i]]
+        return i
+
+    def in_same_set(self, i: int, j: int) -> bool:
+        return self.find(i) == self.find(j)
+
+    def size(self, i: int) -> int:
+        """Size of the component containing i."""
+        return self.sizes[self.find(i)]
+
+    def merge(self, i: int, j: int) -> None:
+        i = self.find(i)
+        j = self.find(j)
+
+        if i == j:
+            return
+
+        if self.sizes[i] < self.sizes[j]:
+            i, j = j, i
+        self.parents[j] = i
+        self.sizes[i] += self.sizes[j]
+        self.num_sets -= 1
+
+    def merge_edges(self, src, dst) -> None:
+        """Merges every pair (src[k], dst[k]) in a single pass."""
+        if hasattr(src, "tolist"):
+            src, dst = src.tolist(), dst.tolist()
+        parents, sizes = self.parents, self.sizes
+        merged = 0
+        for i, j in zip(src, dst):
+            while parents[i] != i:
+                parents[i] = i = parents[parents[i]]
+            while parents[j] != j:
+                parents[j] = j = parents[parents[j]]
+            if i == j:
+                continue
+            if sizes[i] < sizes[j]:
+                i, j = j, i
+            parents[j] = i
+            sizes[i] += sizes[j]
+            merged += 1
+        self.num_sets -= merged
+
+    def labels(self) -> array:
+        """
+        Component label of every node as array('i'). Labels run from 0 to
+        num_sets - 1 in order of each component's first node.
+        """
+        parents = self.parents
+        label_of_root = {}
+        labels = array("i", bytes(4 * self.n))
+        for i in range(self.n):
+            root = i
+            while parents[root] != root:
+                parents[root] = root = parents[parents[root]]
+            label = label_of_root.get(root)
+            if label is None:
+                label = label_of_root[root] = len(label_of_root)
+            labels[i] = label
+        return labels
+
+    def component_sizes(self) -> array:
+        """Size of every component as array('i'), indexed by labels()."""
+        sizes = array("i", bytes(4 * self.num_sets))
+        for label in self.labels():
+            sizes[label] += 1
+        return sizes
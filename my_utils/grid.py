@@ -0,0 +1,289 @@
+"""Character grids, matrix helpers and grid printing."""
+
+import operator
+import sys
+from collections import Counter
+from itertools import chain
+
+from ._lazy import np
+from .geometry import Point
+
+
+def new_table(width, height, val=None):
+    """Returns a `width` by `height` table populated with `val`."""
+    return [[val for _ in range(width)] for _ in range(height)]
+
+
+def transposed(matrix):
+    """Returns the transpose of the given matrix."""
+    return [list(r) for r in zip(*matrix)]
+
+
+def rotated(matrix):
+    """Returns the given matrix rotated 90 degrees clockwise."""
+    return [list(r) for r in zip(*matrix[::-1])]
+
+
+def firsts(matrix):
+    """Like matrix[0], but for the first column."""
+    return rotated(matrix)[0]
+
+
+def lasts(matrix):
+    """Like matrix[-1], but for the last column."""
+    return rotated(matrix)[-1]
+
+
+def _xy_arrays(points):
+    """Returns the x and y coordinates of `points` as two int64 arrays."""
+    n = len(points)
+    if type(points[0]) is tuple:
+        flat = chain.from_iterable(points)
+    else:
+        flat = chain.from_iterable(map(operator.attrgetter("x", "y"), points))
+    coords = np.fromiter(flat, dtype=np.int64, count=2 * n).reshape(n, 2)
+    return coords[:, 0], coords[:, 1]
+
+
+def min_max_xy(points):
+    """
+    For a list of points, returns min_x, max_x, min_y, max_y.
+    This works on tuples (x, y) and Point(x, y).
+    """
+    if len(points) == 0:
+        return None, None, None, None
+    xs, ys = _xy_arrays(points)
+    return int(xs.min()), int(xs.max()), int(ys.min()), int(ys.max())
+
+
+def _raster_rows(codes, palette):
+    """Yields each row of a 2D array of palette indices as a string."""
+    if all(len(p) == 1 for p in palette):
+        # Turn the rows into fixed-width unicode strings in one shot.
+        chars = np.array([ord(p) for p in palette], dtype=np.uint32)
+        width = codes.shape[1]
+        rows = np.ascontiguousarray(chars[codes]).view("<U%d" % width).ravel()
+        for row in rows:
+            yield str(row).ljust(width, "\0") if len(row) < width else str(row)
+    else:
+        for row in codes.tolist():
+            yield "".join(palette[i] for i in row)
+
+
+def print_grid(grid, f=None, quiet=False, out=None, counts_only=False):
+    """
+    Outputs `grid` to stdout. This works whether `grid` is a 2D array,
+    a Grid, or a sparse matrix (dictionary) with keys either (x, y) or
+    Point(x, y). Missing cells of a sparse matrix are rendered as f(" ").
+
+    This function also returns a tuple (a, b), where a is the serialized
+    representation of the grid, in case what gets printed out to stdout
+    needs to be consumed afterwards, and b is a Counter over the values
+    in `grid`.
+
+    Sparse grids are rasterised into a NumPy buffer with a single pass over
+    the keys, `f` is called once per distinct value, and rows are written
+    out one at a time as they are produced.
+
+    Arguments:
+        f: a function to transform the values of grid to something printable.
+        quiet: don't output anything.
+        out: file-like object to write to instead of stdout.
+        counts_only: skip building and printing rows entirely, and only
+            gather the Counter (and statistics, unless quiet).
+
+    Returns:
+        List[String]: Serialized, printable version of the grid
+            (None if counts_only).
+        Counter: The values contained in the grid.
+    """
+    if f is None:
+        f = str
+    if out is None:
+        out = sys.stdout
+    if isinstance(grid, Grid):
+        grid = grid.rows()
+
+    # Rendered string for every distinct value, by palette index.
+    palette = []
+    index_of = {}
+
+    def code(value):
+        i = index_of.get(value)
+        if i is None:
+            i = index_of[value] = len(palette)
+            palette.append(f(value))
+        return i
+
+    if type(grid) is dict:
+        if not grid:
+            return (None if counts_only else []), Counter()
+        xs, ys = _xy_arrays(list(grid))
+        min_x, max_x, min_y, max_y = xs.min(), xs.max(), ys.min(), ys.max()
+        codes = np.full((max_y - min_y + 1, max_x - min_x + 1), code(" "), np.intp)
+        for value in dict.fromkeys(grid.values()):
+            code(value)
+        codes[ys - min_y, xs - min_x] = list(map(index_of.__getitem__, grid.values()))
+        min_x, max_x, min_y, max_y = int(min_x), int(max_x), int(min_y), int(max_y)
+    else:
+        min_x = min_y = 0
+        max_y = len(grid) - 1
+        max_x = len(grid[0]) - 1 if grid else -1
+        codes = np.array([[code(v) for v in row] for row in grid], dtype=np.intp)
+        codes = codes.reshape(len(grid), -1)
+
+    counts = Counter()
+    tally = np.bincount(codes.ravel(), minlength=len(palette))
+    for rendered, num in zip(palette, tally.tolist()):
+        if num:
+            for c in rendered:
+                counts[c] += num
+
+    serialized = None
+    if not counts_only:
+        serialized = []
+        for row in _raster_rows(codes, palette):
+            if not quiet:
+                out.write(row + "\n")
+            serialized.append(row)
+
+    if not quiet:
+        out.write("height={} ({} -> {})\n".format(max_y - min_y + 1, min_y, max_y))
+        out.write("width={} ({} -> {})\n".format(max_x - min_x + 1, min_x, max_x))
+        out.write("Statistics:\n")
+        for item, num in counts.most_common():
+            out.write("{}: {}\n".format(item, num))
+
+    return serialized, counts
+
+
+class Grid:
+    """
+    Dense character grid stored row-major in a flat bytearray.
+
+    The grid is surrounded by a one-cell border of `border` bytes, so walking
+    off the edge lands on a sentinel instead of needing a bounds check. Cells
+    are addressed by a single integer index; `offsets_4` and `offsets_8` hold
+    the index deltas for neighbouring cells in the same order as DIRS_4 and
+    DIRS_8 (north first, rows growing downwards).
+
+    Example:
+
+    grid = Grid(["#.", ".#"])
+    start = grid.find("#")
+    [n for n in grid.neighbours_4(start)]  # in-bounds neighbour indices
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "stride",
+        "border",
+        "cells",
+        "offsets_4",
+        "offsets_8",
+    )
+
+    def __init__(self, lines, border="\0"):
+        rows = [line.rstrip("\n") for line in lines]
+        while rows and not rows[-1]:
+            rows.pop()
+        self.height = len(rows)
+        self.width = max((len(row) for row in rows), default=0)
+        self.stride = stride = self.width + 2
+        self.border = ord(border)
+
+        pad = border * stride
+        body = "".join(border + row.ljust(self.width, border) + border for row in rows)
+        self.cells = bytearray((pad + body + pad).encode("latin-1"))
+
+        self.offsets_4 = (-stride, 1, stride, -1)
+        self.offsets_8 = (
+            -stride,
+            -stride + 1,
+            1,
+            stride + 1,
+            stride,
+            stride - 1,
+            -1,
+            -stride - 1,
+        )
+
+    def copy(self):
+        other = object.__new__(Grid)
+        for name in Grid.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.cells = bytearray(self.cells)
+        return other
+
+    def index(self, r, c):
+        """Flat index of row `r`, column `c` (both 0-based, excluding the border)."""
+        return (r + 1) * self.stride + c + 1
+
+    def coords(self, i):
+        """Inverse of index(): returns (r, c) for flat index `i`."""
+        r, c = divmod(i, self.stride)
+        return r - 1, c - 1
+
+    def point(self, i):
+        """Returns flat index `i` as Point(x=c, y=r)."""
+        r, c = divmod(i, self.stride)
+        return Point(c - 1, r - 1)
+
+    def in_bounds(self, i):
+        return self.cells[i] != self.border
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __getitem__(self, i):
+        return chr(self.cells[i])
+
+    def __setitem__(self, i, char):
+        self.cells[i] = ord(char)
+
+    def __contains__(self, char):
+        return ord(char) in self.cells
+
+    def indices(self):
+        """Yields the flat index of every non-border cell, row by row."""
+        stride = self.stride
+        for r in range(1, self.height + 1):
+            yield from range(r * stride + 1, r * stride + self.width + 1)
+
+    def find(self, char):
+        """Flat index of the first `char` in the grid, or -1 if absent."""
+        return self.cells.find(ord(char))
+
+    def positions(self, char):
+        """Flat indices of every `char` in the grid, in ascending order."""
+        cells = np.frombuffer(self.cells, dtype=np.uint8)
+        return np.flatnonzero(cells == ord(char)).tolist()
+
+    def neighbours_4(self, i):
+        cells, border = self.cells, self.border
+        return [i + d for d in self.offsets_4 if cells[i + d] != border]
+
+    def neighbors_4(self, i):
+        return self.neighbours_4(i)
+
+    def neighbours_8(self, i):
+        cells, border = self.cells, self.border
+        return [i + d for d in self.offsets_8 if cells[i + d] != border]
+
+    def neighbors_8(self, i):
+        return self.neighbours_8(i)
+
+    def rows(self):
+        """Returns the grid contents as a list of strings, without the border."""
+        stride, width = self.stride, self.width
+        return [
+            self.cells[r * stride + 1 : r * stride + width + 1].decode("latin-1")
+            for r in range(1, self.height + 1)
+        ]
+
+    def __str__(self):
+        return "\n".join(self.rows())
+
+    def __repr__(self):
+        return "Grid(width={}, height={})".format(self.width, self.height)
@@ -0,0 +1,52 @@
+"""Hash helpers."""
+
+import hashlib
+
+
+def md5(msg):
+    m = hashlib.md5()
+    m.update(msg)
+    return m.hexdigest()
+
+
+def sha256(msg):
+    s = hashlib.sha256()
+    s.update(msg)
+    return s.hexdigest()
+
+
+def HASH(code):
+    val = 0
+    for c in code:
+        val += ord(c)
+        val *= 17
+        val %= 256
+    return val
+
+
+def knot_hash(msg):
+    lengths = [ord(x) for x in msg] + [17, 31, 73, 47, 23]
+    sparse = range(0, 256)
+    pos = 0
+    skip = 0
+
+    for _ in range(64):
+        for l in lengths:
+            for i in range(l // 2):
+                x = (pos + i) % len(sparse)
+                y = (pos + l - i - 1) % len(sparse)
+                sparse[x], sparse[y] = sparse[y], sparse[x]
+
+            pos = pos + l + skip % len(sparse)
+            skip += 1
+
+    hash_val = 0
+
+    for i in range(16):
+        res = 0
+        for j in range(0, 16):
+            res ^= sparse[(i * 16) + j]
+
+        hash_val += res << ((16 - i - 1) * 8)
+
+    return "%032x" % hash_val
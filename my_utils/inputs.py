@@ -0,0 +1,184 @@
+"""
+Memory-mapped puzzle input with an on-disk parse cache.
+
+hashlib, inspect and pickle are only needed by the cache, so they are
+imported there; a day that just reads lines doesn't pay for them.
+"""
+
+import mmap
+import os
+
+CACHE_DIR = ".aoc_cache"
+
+
+_PACKAGE_DIGEST = None
+
+
+def _package_digest():
+    """Digest of every my_utils source file, since any of them may define
+    classes that end up in a cached parse."""
+    global _PACKAGE_DIGEST
+    if _PACKAGE_DIGEST is None:
+        import hashlib
+        from glob import glob
+
+        h = hashlib.blake2b(digest_size=16)
+        for source in sorted(glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+            with open(source, "rb") as f:
+                h.update(f.read())
+        _PACKAGE_DIGEST = h.digest()
+    return _PACKAGE_DIGEST
+
+
+class PuzzleInput:
+    """
+    A day's puzzle input, memory-mapped rather than read up front.
+
+    lines() decodes one line at a time, and parse() caches the result of a
+    parse_input() function on disk, keyed by a hash of the input bytes, the
+    source file defining parse_input, and the my_utils sources. Editing any of
+    them invalidates the cache.
+
+    The file is mapped on first use and unmapped again once lines(), text()
+    or parse() is done with it, so load_input(__file__).parse(...) leaves
+    nothing open. Using it as a context manager closes it early.
+    """
+
+    __slots__ = ("path", "_data")
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+
+    @property
+    def data(self):
+        """The mapped file (b"" when it is empty), mapped on first access."""
+        if self._data is None:
+            with open(self.path, "rb") as f:
+                try:
+                    self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped.
+                    self._data = b""
+        return self._data
+
+    def __len__(self):
+        return os.path.getsize(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+
+    def lines(self):
+        """Yields each line without its line ending, decoding lazily."""
+        try:
+            data = self.data
+            start, end = 0, len(data)
+            while start < end:
+                stop = data.find(b"\n", start)
+                if stop == -1:
+                    stop = end
+                line = data[start:stop]
+                if line.endswith(b"\r"):
+                    line = line[:-1]
+                yield line.decode()
+                start = stop + 1
+        finally:
+            self.close()
+
+    def text(self):
+        try:
+            return bytes(self.data).decode()
+        finally:
+            self.close()
+
+    def cache_key(self, parse_input):
+        import hashlib
+        import inspect
+
+        h = hashlib.blake2b(self.data, digest_size=16)
+        h.update(parse_input.__module__.encode())
+        h.update(parse_input.__qualname__.encode())
+        source = inspect.getsourcefile(parse_input)
+        if source is not None:
+            with open(source, "rb") as f:
+                h.update(f.read())
+        h.update(_package_digest())
+        return h.hexdigest()
+
+    def parse(self, parse_input):
+        """
+        Returns parse_input(list(self.lines())), from the on-disk cache when
+        nothing has changed since the last run. Results that cannot be
+        pickled are simply not cached.
+        """
+        import hashlib
+        import pickle
+
+        # The same day runs under several module names (__main__, solution,
+        # the runner's aoc_YYYY_DD), so each gets its own cache entries and
+        # only replaces those.
+        name = "{}.{}".format(parse_input.__module__, parse_input.__qualname__)
+        tag = hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
+        stem = os.path.splitext(os.path.basename(self.path))[0]
+        prefix = "{}.{}.".format(stem, tag)
+        cache_dir = os.path.join(os.path.dirname(self.path), CACHE_DIR)
+        try:
+            key = self.cache_key(parse_input)
+        finally:
+            self.close()
+        cache_file = os.path.join(cache_dir, "{}{}.pickle".format(prefix, key))
+
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (
+            OSError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            pickle.UnpicklingError,
+        ):
+            pass
+
+        result = parse_input(list(self.lines()))
+
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            os.makedirs(cache_dir, exist_ok=True)
+            for entry in os.listdir(cache_dir):
+                if entry.startswith(prefix) and entry.endswith(".pickle"):
+                    os.remove(os.path.join(cache_dir, entry))
+            tmp = cache_file + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, cache_file)
+        except (OSError, TypeError, AttributeError, pickle.PicklingError):
+            pass
+
+        return result
+
+
+def load_input(day_dir, example=False):
+    """
+    Opens the puzzle input for `day_dir`, which may also be a file inside it
+    (so `load_input(__file__)` works from a solution).
+
+    Uses input.txt, falling back to example_input.txt when there is no real
+    input; pass example=True to always use the example.
+    """
+    if os.path.isfile(day_dir):
+        day_dir = os.path.dirname(os.path.abspath(day_dir))
+    names = ["example_input.txt"] if example else ["input.txt", "example_input.txt"]
+    for name in names:
+        path = os.path.join(day_dir, name)
+        if os.path.exists(path):
+            return PuzzleInput(path)
+    raise FileNotFoundError("no {} in {}".format(" or ".join(names), day_dir))
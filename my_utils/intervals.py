@@ -0,0 +1,331 @@
+"""Sorted sets of integer ranges and piecewise offset maps over them."""
+
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+from ._lazy import np
+
+
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint, half-open [start, stop) spans.
+
+    Touching spans are merged, so the representation is canonical. Adding,
+    discarding or clipping one span bisects to the k spans it touches, making
+    each O(log n + k); whole-set union and intersection merge the two span
+    lists in a single linear pass. The total length is kept up to date as
+    spans change, so len() is O(1).
+
+    Iterating yields the (start, stop) spans; `x in s` tests a single integer.
+
+    Example:
+
+    s = IntervalSet([(0, 5), (10, 15)])
+    s.add(5, 8)  # spans are now [0, 8) and [10, 15)
+    len(s)  # 13
+    list(s.gaps(0, 20))  # [(8, 10), (15, 20)]
+    """
+
+    __slots__ = ("starts", "stops", "_length")
+
+    def __init__(self, spans=()):
+        self.starts = []
+        self.stops = []
+        self._length = 0
+        for start, stop in spans:
+            self.add(start, stop)
+
+    @classmethod
+    def _from_sorted(cls, starts, stops):
+        """Wraps span lists that are already sorted, disjoint and merged."""
+        s = cls.__new__(cls)
+        s.starts, s.stops = starts, stops
+        s._length = sum(stops) - sum(starts)
+        return s
+
+    def copy(self):
+        s = IntervalSet.__new__(IntervalSet)
+        s.starts, s.stops, s._length = self.starts[:], self.stops[:], self._length
+        return s
+
+    def __len__(self):
+        """Number of integers covered, not the number of spans."""
+        return self._length
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.stops)
+
+    def __contains__(self, x):
+        i = bisect_right(self.starts, x) - 1
+        return i >= 0 and x < self.stops[i]
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.stops == other.stops
+
+    def __repr__(self):
+        return "IntervalSet({})".format(list(self))
+
+    @property
+    def span_count(self):
+        return len(self.starts)
+
+    def bounds(self):
+        """Returns (min, stop) of the whole set, or None if it is empty."""
+        if not self.starts:
+            return None
+        return self.starts[0], self.stops[-1]
+
+    def add(self, start, stop):
+        """Adds [start, stop), merging any spans it overlaps or touches."""
+        if start >= stop:
+            return
+        starts, stops = self.starts, self.stops
+        i = bisect_left(stops, start)
+        j = bisect_right(starts, stop)
+        if i < j:
+            self._length -= sum(stops[i:j]) - sum(starts[i:j])
+            start = min(start, starts[i])
+            stop = max(stop, stops[j - 1])
+        starts[i:j] = [start]
+        stops[i:j] = [stop]
+        self._length += stop - start
+
+    def discard(self, start, stop):
+        """Removes [start, stop), splitting a span that straddles either end."""
+        if start >= stop:
+            return
+        starts, stops = self.starts, self.stops
+        i = bisect_right(stops, start)
+        j = bisect_left(starts, stop)
+        if i >= j:
+            return
+        self._length -= sum(stops[i:j]) - sum(starts[i:j])
+        new_starts, new_stops = [], []
+        if starts[i] < start:
+            new_starts.append(starts[i])
+            new_stops.append(start)
+        if stops[j - 1] > stop:
+            new_starts.append(stop)
+            new_stops.append(stops[j - 1])
+        starts[i:j] = new_starts
+        stops[i:j] = new_stops
+        self._length += sum(new_stops) - sum(new_starts)
+
+    def overlapping(self, start, stop):
+        """Yields the spans of the set inside [start, stop), clipped to it."""
+        starts, stops = self.starts, self.stops
+        for i in range(bisect_right(stops, start), bisect_left(starts, stop)):
+            yield max(starts[i], start), min(stops[i], stop)
+
+    def gaps(self, start, stop):
+        """Yields the spans of [start, stop) that are not in the set."""
+        x = start
+        for lo, hi in self.overlapping(start, stop):
+            if x < lo:
+                yield x, lo
+            x = hi
+        if x < stop:
+            yield x, stop
+
+    def union(self, other):
+        starts, stops = [], []
+        for lo, hi in merge(self, other):
+            if stops and lo <= stops[-1]:
+                if hi > stops[-1]:
+                    stops[-1] = hi
+            else:
+                starts.append(lo)
+                stops.append(hi)
+        return IntervalSet._from_sorted(starts, stops)
+
+    def intersection(self, other):
+        starts, stops = [], []
+        a, b = list(self), list(other)
+        i = j = 0
+        while i < len(a) and j < len(b):
+            lo = max(a[i][0], b[j][0])
+            hi = min(a[i][1], b[j][1])
+            if lo < hi:
+                starts.append(lo)
+                stops.append(hi)
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_sorted(starts, stops)
+
+    def difference(self, other):
+        result = self.copy()
+        for start, stop in other:
+            result.discard(start, stop)
+        return result
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class PiecewiseOffsetMap:
+    """
+    Maps integers by adding the offset of the half-open span they fall in.
+
+    Spans are sorted and disjoint; integers outside every span map to
+    themselves. A single point is found by bisection, and map_range() pushes
+    a whole [start, stop) through the map, yielding the image of each piece
+    in O(log n + k). then() composes two maps into one, so a chain of maps
+    can be collapsed before any points go through it, and map_points() maps
+    a whole NumPy array with a single searchsorted.
+
+    Example:
+
+    m = PiecewiseOffsetMap([(98, 100, -48), (50, 98, 2)])
+    m[99]  # 51
+    list(m.map_range(90, 102))  # [(92, 100), (50, 52), (100, 102)]
+    m.then(n)  # one map doing m and then n
+    """
+
+    __slots__ = ("starts", "stops", "offsets")
+
+    def __init__(self, spans=()):
+        self.starts = []
+        self.stops = []
+        self.offsets = []
+        for start, stop, offset in spans:
+            self.add(start, stop, offset)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.stops, self.offsets)
+
+    def __repr__(self):
+        return "PiecewiseOffsetMap({})".format(list(self))
+
+    def add(self, start, stop, offset):
+        """
+        Maps [start, stop) by `offset`.
+
+        Raises:
+            ValueError: If the span overlaps one already in the map.
+        """
+        if start >= stop:
+            return
+        i = bisect_right(self.starts, start)
+        if (i > 0 and self.stops[i - 1] > start) or (
+            i < len(self.starts) and self.starts[i] < stop
+        ):
+            raise ValueError("span [{}, {}) overlaps the map".format(start, stop))
+        self.starts.insert(i, start)
+        self.stops.insert(i, stop)
+        self.offsets.insert(i, offset)
+
+    def __getitem__(self, x):
+        i = bisect_right(self.starts, x) - 1
+        if i >= 0 and x < self.stops[i]:
+            return x + self.offsets[i]
+        return x
+
+    def as_arrays(self):
+        """
+        Returns (breakpoints, offsets) as int64 NumPy arrays, the map as a step
+        function: points below breakpoints[0] take offsets[0], points in
+        [breakpoints[i - 1], breakpoints[i]) take offsets[i], and so on. Gaps
+        between spans are explicit 0 offsets.
+        """
+        breakpoints, offsets = [], [0]
+        for start, stop, offset in self:
+            if breakpoints and breakpoints[-1] == start:
+                offsets[-1] = offset
+            else:
+                breakpoints.append(start)
+                offsets.append(offset)
+            breakpoints.append(stop)
+            offsets.append(0)
+        return np.array(breakpoints, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+    def map_points(self, points):
+        """
+        Maps an array of points at once with a single np.searchsorted.
+
+        Args:
+            points: Array-like of integers that fit in int64.
+
+        Returns:
+            np.ndarray: The mapped points, int64, in the same shape.
+        """
+        points = np.asarray(points, dtype=np.int64)
+        breakpoints, offsets = self.as_arrays()
+        return points + offsets[np.searchsorted(breakpoints, points, side="right")]
+
+    def pieces(self, start, stop):
+        """
+        Splits [start, stop) at the map's breakpoints, yielding
+        (lo, hi, offset) in order; unmapped gaps have offset 0.
+        """
+        starts, stops, offsets = self.starts, self.stops, self.offsets
+        x = start
+        i = max(bisect_right(starts, start) - 1, 0)
+        while x < stop and i < len(starts):
+            if stops[i] <= x:
+                i += 1
+                continue
+            if starts[i] > x:
+                # Unmapped gap before the next span.
+                hi = min(starts[i], stop)
+                yield x, hi, 0
+                x = hi
+                continue
+            hi = min(stops[i], stop)
+            yield x, hi, offsets[i]
+            x = hi
+            i += 1
+        if x < stop:
+            yield x, stop, 0
+
+    def map_range(self, start, stop):
+        """Yields the image spans of [start, stop), in source order."""
+        for lo, hi, offset in self.pieces(start, stop):
+            yield lo + offset, hi + offset
+
+    def then(self, other):
+        """
+        Returns the map that applies this one and then `other`, so that
+        m.then(n)[x] == n[m[x]] for every x.
+
+        Only the union of both maps' spans can move a point, so each piece of
+        it is pushed through `other` and split where `other`'s breakpoints
+        land. Neighbouring pieces that end up with the same offset are merged.
+        """
+        domain = IntervalSet(zip(self.starts, self.stops))
+        for start, stop, _ in other:
+            domain.add(start, stop)
+        composed = PiecewiseOffsetMap()
+        starts, stops, offsets = composed.starts, composed.stops, composed.offsets
+        for start, stop in domain:
+            for lo, hi, first in self.pieces(start, stop):
+                for lo2, hi2, second in other.pieces(lo + first, hi + first):
+                    offset = first + second
+                    if offset == 0:
+                        continue
+                    lo2, hi2 = lo2 - first, hi2 - first
+                    if stops and stops[-1] == lo2 and offsets[-1] == offset:
+                        stops[-1] = hi2
+                    else:
+                        starts.append(lo2)
+                        stops.append(hi2)
+                        offsets.append(offset)
+        return composed
+
+    def map_set(self, spans):
+        """Returns the image of an IntervalSet (or any spans) as an IntervalSet."""
+        image = IntervalSet()
+        for start, stop in spans:
+            for lo, hi in self.map_range(start, stop):
+                image.add(lo, hi)
+        return image
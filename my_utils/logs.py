@@ -0,0 +1,150 @@
+"""Logging setup and the LazyLogger facade over loguru."""
+
+import sys
+import warnings
+from typing import Optional
+
+try:
+    from loguru import logger
+except ImportError:
+    logger = None
+
+
+LOG_LEVELS = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+LOG_FORMAT = (
+    "<level>{time:YYYY-MM-DD hh:mm:ss A}</level> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level> "
+)
+# Refreshed by setup_logging; read it as my_utils.DEBUG_ENABLED or
+# logger.debug_enabled, a ``from`` import would freeze the value at import time.
+DEBUG_ENABLED = False
+
+
+def _discard(*args, **kwargs) -> None:
+    pass
+
+
+class LazyLogger:
+    """
+    Loguru facade whose disabled calls return before touching the message.
+
+    ``logger.debug("at {}", pos)`` is formatted only when DEBUG is on, and a
+    callable message (``logger.debug(lambda: expensive())``) is only called
+    then. Inside hot loops, guard the call with ``logger.debug_enabled`` (or a
+    local copy of it) so a disabled call costs one branch. Anything else is
+    forwarded to the loguru logger.
+    """
+
+    def __init__(self, sink_logger):
+        self._logger = sink_logger
+        self.level = None
+        self._set_level("INFO")
+
+    def _set_level(self, level: str) -> None:
+        self.level = level
+        threshold = LOG_LEVELS.index(level)
+        for name in LOG_LEVELS:
+            enabled = LOG_LEVELS.index(name) >= threshold
+            setattr(self, f"{name.lower()}_enabled", enabled)
+            # Shadow disabled levels with a bare no-op so calling them skips
+            # even the bound-method creation and the flag test.
+            if enabled:
+                self.__dict__.pop(name.lower(), None)
+            else:
+                setattr(self, name.lower(), _discard)
+
+    def _log(self, level: str, message, args, kwargs) -> None:
+        # depth=2 attributes the record to our caller, not to the facade.
+        if callable(message):
+            self._logger.opt(depth=2).log(level, message(), *args, **kwargs)
+        else:
+            self._logger.opt(depth=2).log(level, message, *args, **kwargs)
+
+    def trace(self, message, *args, **kwargs) -> None:
+        if self.trace_enabled:
+            self._log("TRACE", message, args, kwargs)
+
+    def debug(self, message, *args, **kwargs) -> None:
+        if self.debug_enabled:
+            self._log("DEBUG", message, args, kwargs)
+
+    def info(self, message, *args, **kwargs) -> None:
+        if self.info_enabled:
+            self._log("INFO", message, args, kwargs)
+
+    def success(self, message, *args, **kwargs) -> None:
+        if self.success_enabled:
+            self._log("SUCCESS", message, args, kwargs)
+
+    def warning(self, message, *args, **kwargs) -> None:
+        if self.warning_enabled:
+            self._log("WARNING", message, args, kwargs)
+
+    def error(self, message, *args, **kwargs) -> None:
+        if self.error_enabled:
+            self._log("ERROR", message, args, kwargs)
+
+    def critical(self, message, *args, **kwargs) -> None:
+        if self.critical_enabled:
+            self._log("CRITICAL", message, args, kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._logger, name)
+
+
+log = LazyLogger(logger)
+_log_sink = None
+_log_level = None
+
+
+def setup_logging(log_level: Optional[str] = None, force: bool = False) -> LazyLogger:
+    """
+    Setup loguru logging.
+
+    The stderr sink is installed by the first call in the process, so whoever
+    configures first, e.g. the runner, picks the level. Later calls return the
+    same logger. A later call that asks for a different level warns that it
+    was ignored; leave log_level out (as solution modules do on import) to
+    just use whatever is configured.
+
+    Args:
+        log_level (str): The log level to be set. Default = None, which means
+            the current level, or "INFO" if logging isn't set up yet.
+        force (bool): Replace the sink even if one is already installed.
+
+    Returns:
+        LazyLogger: Shared logger facade.
+    """
+    global DEBUG_ENABLED, _log_sink, _log_level
+
+    # Validate the log level
+    if log_level is not None and log_level.upper() not in LOG_LEVELS:
+        raise ValueError(
+            f"Invalid log level: {log_level}. Valid log levels are: {', '.join(LOG_LEVELS)}"
+        )
+    if logger is None:
+        raise ImportError(
+            "Please install the 'loguru' package by running 'pip install loguru'"
+        )
+    if _log_sink is not None and not force:
+        if log_level is not None and log_level.upper() != _log_level:
+            warnings.warn(
+                f"setup_logging({log_level.upper()!r}) ignored: logging is already "
+                f"set up at {_log_level}; pass force=True to change it",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return log
+    log_level = (log_level or _log_level or "INFO").upper()
+
+    # Remove all built-in handlers, or our previous sink
+    logger.remove(_log_sink)
+    _log_sink = logger.add(sys.stderr, format=LOG_FORMAT, level=log_level)
+    _log_level = log_level
+    log._set_level(log_level)
+    DEBUG_ENABLED = log.debug_enabled
+
+    log.debug("Logging setup complete with level: {}", log_level)
+
+    return log
@@ -0,0 +1,367 @@
+"""Primes, factorisation and modular arithmetic."""
+
+import math
+from collections import Counter
+
+from ._lazy import np
+from .cache import memoize
+
+
+def gcd(*nums):
+    """Compute the greatest common divisor of any number of integers."""
+    return math.gcd(*nums)
+
+
+def lcm(*nums):
+    """Compute the lowest common multiple of any number of integers, exactly."""
+    return math.lcm(*nums)
+
+
+def egcd(a, b):
+    """Returns (g, x, y) such that a * x + b * y == g == gcd(a, b)."""
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b:
+        q, a, b = a // b, b, a % b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+
+def modinv(a, n):
+    """Returns the inverse of a modulo n."""
+    try:
+        return pow(a, -1, n)
+    except ValueError:
+        raise ValueError("%d is not invertible mod %d" % (a, n)) from None
+
+
+def crt_merge(r1, m1, r2, m2):
+    """
+    Merges x = r1 (mod m1) and x = r2 (mod m2) into a single congruence.
+    The moduli need not be coprime.
+
+    Returns (r, m) with m = lcm(m1, m2), or raises ValueError if the two
+    congruences have no common solution.
+    """
+    g = math.gcd(m1, m2)
+    diff = r2 - r1
+    if diff % g:
+        raise ValueError(
+            "inconsistent remainders %d (mod %d) and %d (mod %d)" % (r1, m1, r2, m2)
+        )
+    m2g = m2 // g
+    k = diff // g * pow(m1 // g, -1, m2g) % m2g if m2g > 1 else 0
+    m = m1 * m2g
+    return (r1 + m1 * k) % m, m
+
+
+def crt(rems, mods):
+    """
+    Solve a system of modular equivalences via the Chinese Remainder Theorem.
+    Does not require pairwise coprime moduli.
+
+    Returns (n, m), where n is the solution and m is the modulo.
+
+    Arguments
+      rems: the remainders of the problem
+      mods: the modulos of the problem
+
+    """
+    n, m = 0, 1
+    for r, k in zip(rems, mods):
+        n, m = crt_merge(n, m, r, k)
+    return n, m
+
+
+def linear_congruence(a, b, m):
+    """
+    Solves a * x = b (mod m).
+
+    Returns (x, m'), meaning every solution is x + k * m' for integer k.
+    Raises ValueError if there is no solution.
+    """
+    g = math.gcd(a, m)
+    if b % g:
+        raise ValueError("%d * x = %d (mod %d) has no solution" % (a, b, m))
+    m //= g
+    if m == 1:
+        return 0, 1
+    return b // g * pow(a // g, -1, m) % m, m
+
+
+def solve_congruences(congruences):
+    """
+    Solves a system of linear congruences a_i * x = b_i (mod m_i) in one go,
+    reducing each to x = r_i (mod m_i') and merging them with crt_merge().
+
+    Arguments
+      congruences: iterable of (a, b, m) triples
+
+    Returns (x, m) like crt(), or raises ValueError if the system is
+    inconsistent.
+    """
+    n, m = 0, 1
+    for a, b, k in congruences:
+        r, k = linear_congruence(a, b, k)
+        n, m = crt_merge(n, m, r, k)
+    return n, m
+
+
+def _miller_rabin(n):
+    """Deterministic Miller-Rabin, exact for every n < 3.3 * 10**24."""
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in bases:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+class Sieve:
+    """
+    Incremental sieve holding a smallest-prime-factor (SPF) table.
+
+    `spf[n]` is the smallest prime dividing n (0 for n < 2), and `bits[n]`
+    is a boolean primality map over the same range. Both grow on demand:
+    asking about a number past the current limit sieves just the new
+    segment using the primes already known, doubling the range each time.
+
+    Example:
+
+    sieve = Sieve()
+    sieve.is_prime(97)  # True
+    sieve.prime_factors(360)  # [2, 2, 2, 3, 3, 5]
+    sieve.factorise_many(np.arange(2, 10))  # one row of factors per value
+    """
+
+    # The SPF table is int32, which bounds how far the sieve can grow.
+    MAX_LIMIT = 2**31 - 1
+    # Past this, numbers are tested rather than sieved up to.
+    TRIAL_LIMIT = 2**24
+
+    __slots__ = ("spf", "bits")
+
+    def __init__(self, n=0):
+        self.spf = np.zeros(0, dtype=np.int32)
+        self.bits = np.zeros(0, dtype=np.bool_)
+        self.extend(n)
+
+    @property
+    def limit(self):
+        """The sieve covers [0, limit)."""
+        return len(self.spf)
+
+    def extend(self, n):
+        """Makes sure the sieve covers [0, n]."""
+        if n < self.limit:
+            return
+        hi = max(n + 1, 2 * self.limit, 1024)
+        if hi > self.MAX_LIMIT:
+            if n >= self.MAX_LIMIT:
+                raise ValueError("cannot sieve up to %d" % n)
+            hi = self.MAX_LIMIT
+        lo = self.limit
+        root = math.isqrt(hi - 1)
+
+        if root >= lo:
+            # The primes needed for the new segment aren't known yet, so
+            # sieve the whole range from scratch.
+            spf = np.zeros(hi, dtype=np.int32)
+            for p in range(2, root + 1):
+                if spf[p] == 0:
+                    multiples = spf[p * p :: p]
+                    multiples[multiples == 0] = p
+            lo = 0
+        else:
+            # Assign largest primes first so the smallest factor wins.
+            spf = np.zeros(hi - lo, dtype=np.int32)
+            known = np.flatnonzero(self.bits[: root + 1])
+            for p in known[::-1].tolist():
+                start = max(p * p, -(-lo // p) * p)
+                spf[start - lo :: p] = p
+
+        values = np.arange(lo, hi, dtype=np.int32)
+        unmarked = spf == 0
+        spf[unmarked] = values[unmarked]
+        bits = spf == values
+        if lo == 0:
+            spf[:2] = 0
+            bits[:2] = False
+
+        if lo == 0:
+            self.spf, self.bits = spf, bits
+        else:
+            self.spf = np.concatenate((self.spf, spf))
+            self.bits = np.concatenate((self.bits, bits))
+
+    def is_prime(self, n):
+        """
+        Primality of `n`. Accepts an int, or an array-like of ints for a
+        vectorised lookup that returns a boolean array.
+        """
+        if isinstance(n, (int, np.integer)):
+            n = int(n)
+            if n < 2:
+                return False
+            if n >= self.limit:
+                if n > self.TRIAL_LIMIT:
+                    return _miller_rabin(n)
+                self.extend(n)
+            return bool(self.bits[n])
+        values = np.asarray(n, dtype=np.int64)
+        result = np.zeros(values.shape, dtype=np.bool_)
+        # Like the scalar path, only look up what the table covers or may
+        # grow to; anything bigger goes through Miller-Rabin one by one.
+        small = values < max(self.limit, self.TRIAL_LIMIT + 1)
+        if small.any():
+            self.extend(int(values[small].max()))
+            looked_up = values[small]
+            result[small] = self.bits[np.clip(looked_up, 0, None)] & (looked_up >= 2)
+        for i in np.flatnonzero(~small.ravel()).tolist():
+            result.flat[i] = _miller_rabin(int(values.flat[i]))
+        return result
+
+    def primes(self, n):
+        """Returns a list of primes from [2, n)."""
+        self.extend(n)
+        return np.flatnonzero(self.bits[:n]).tolist()
+
+    def prime_factors(self, n):
+        """Returns the prime factors of n >= 1 in ascending order, with multiplicity."""
+        if n < 1:
+            raise ValueError("cannot factorise %d" % n)
+        out = []
+        if n >= self.limit and n > self.TRIAL_LIMIT:
+            # Too big for the table: trial divide by the sieved primes up to
+            # sqrt(n), falling back to plain trial division past TRIAL_LIMIT.
+            root = math.isqrt(n)
+            self.extend(min(root, self.TRIAL_LIMIT))
+            candidates = np.flatnonzero(self.bits[: root + 1])
+            if n < 2**63:
+                candidates = candidates[n % candidates == 0]
+            for p in candidates.tolist():
+                while n % p == 0:
+                    out.append(p)
+                    n //= p
+            # What is left has no factor below self.limit, so once it is at
+            # most TRIAL_LIMIT or passes Miller-Rabin it is 1 or a prime.
+            # Miller-Rabin only needs rerunning after a division changes n.
+            p = self.limit | 1
+            done = n <= self.TRIAL_LIMIT or _miller_rabin(n)
+            while not done and p * p <= n:
+                if n < 2**63:
+                    # Test a block of odd candidates at once.
+                    stop = min(p + 2**21, math.isqrt(n) + 1)
+                    odd = np.arange(p, stop, 2, dtype=np.int64)
+                    hits = odd[n % odd == 0]
+                    if not len(hits):
+                        p = stop | 1
+                        continue
+                    p = int(hits[0])
+                elif n % p:
+                    p += 2
+                    continue
+                while n % p == 0:
+                    out.append(p)
+                    n //= p
+                done = n <= self.TRIAL_LIMIT or _miller_rabin(n)
+                p += 2
+            if n >= self.limit:
+                out.append(n)
+                return out
+        else:
+            self.extend(n)
+        spf = self.spf
+        while n > 1:
+            p = int(spf[n])
+            out.append(p)
+            n //= p
+        return out
+
+    def factorise_many(self, values):
+        """
+        Factorises every value in `values` at once.
+
+        Returns an int array of shape (len(values), k) whose rows hold each
+        value's prime factors in ascending order, padded on the right with 1.
+        Values past TRIAL_LIMIT that the table doesn't already cover are
+        factorised one by one with prime_factors() instead of growing it.
+        """
+        values = np.array(values, dtype=np.int64).ravel()
+        if values.size == 0:
+            return np.ones((0, 0), dtype=np.int64)
+        if values.min() < 1:
+            raise ValueError("can only factorise positive integers")
+        big = np.flatnonzero(values >= max(self.limit, self.TRIAL_LIMIT + 1))
+        big_factors = [self.prime_factors(n) for n in values[big].tolist()]
+        values[big] = 1
+        self.extend(int(values.max()))
+        spf = self.spf
+        columns = []
+        while True:
+            active = values > 1
+            if not active.any():
+                break
+            column = np.ones_like(values)
+            column[active] = spf[values[active]]
+            values //= column
+            columns.append(column)
+        width = max([len(columns)] + [len(f) for f in big_factors])
+        out = np.ones((len(values), width), dtype=np.int64)
+        if columns:
+            out[:, : len(columns)] = np.stack(columns, axis=1)
+        for row, found in zip(big.tolist(), big_factors):
+            out[row, : len(found)] = found
+        return out
+
+
+_SIEVE = None
+
+
+def _sieve():
+    """The shared Sieve, built on first use so importing stays numpy-free."""
+    global _SIEVE
+    if _SIEVE is None:
+        _SIEVE = Sieve()
+    return _SIEVE
+
+
+def primes(n):
+    """Return a list of primes from [2, n)"""
+    return _sieve().primes(n)
+
+
+def is_prime(n):
+    """Primality of an int, or of every element of an array-like."""
+    return _sieve().is_prime(n)
+
+
+def prime_factors(n):
+    """Returns the prime factors of n in ascending order, with multiplicity."""
+    return _sieve().prime_factors(n)
+
+
+@memoize(maxsize=4096)
+def factors(n):
+    """Returns the factors of n, or [] for n == 0."""
+    if n == 0:
+        return []
+    divisors = [1]
+    for p, e in Counter(prime_factors(n)).items():
+        divisors = [d * p**k for d in divisors for k in range(e + 1)]
+    return sorted(divisors)
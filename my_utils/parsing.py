@@ -0,0 +1,165 @@
+"""Regex helpers and number extraction for puzzle input."""
+
+import operator
+import re
+from array import array
+from functools import reduce
+
+from ._lazy import np
+
+LETTERS = [x for x in "abcdefghijklmnopqrstuvwxyz"]
+VOWELS = {"a", "e", "i", "o", "u"}
+CONSONANTS = set(x for x in LETTERS if x not in VOWELS)
+
+
+_REGEX_CACHE = {}
+
+
+def compiled(pattern, flags=0):
+    """Returns `pattern` compiled, compiling each (pattern, flags) only once."""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    key = (pattern, flags)
+    regex = _REGEX_CACHE.get(key)
+    if regex is None:
+        regex = _REGEX_CACHE[key] = re.compile(pattern, flags)
+    return regex
+
+
+def _intify(group):
+    """
+    int(group) wherever int() accepts it, else group. Plain digits are
+    checked up front so words never cost a raised ValueError.
+    """
+    stripped = group.strip()
+    digits = stripped[1:] if stripped[:1] in ("-", "+") else stripped
+    if digits.isdecimal():
+        return int(group)
+    if "_" in digits:
+        # int() also accepts underscores between digits, e.g. "1_000".
+        try:
+            return int(group)
+        except ValueError:
+            pass
+    return group
+
+
+def parse_line(regex, line):
+    """Returns capture groups in regex for line. Int-ifies numbers."""
+    return [
+        _intify(match)
+        for match in compiled(regex).match(line).groups()
+        if match is not None
+    ]
+
+
+_NUM_RE = re.compile(r"-?\d+")
+_POS_NUM_RE = re.compile(r"\d+")
+
+
+def parse_nums(line, negatives=True):
+    """
+    Returns a list of numbers in `line`.
+
+    Pass negatives=False to parse 1-2 as [1, 2].
+    """
+    num_re = _NUM_RE if negatives else _POS_NUM_RE
+    return list(map(int, num_re.findall(line)))
+
+
+_MINUS = ord("-")
+_ZERO = ord("0")
+# int64 holds every 18-digit number.
+_MAX_DIGITS = 18
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_BYTES_NUM_RE = re.compile(rb"-?[0-9]+")
+_BYTES_POS_NUM_RE = re.compile(rb"[0-9]+")
+
+
+def extract_ints(data, negatives=True, container="list"):
+    """
+    Pulls every integer out of a whole buffer in one vectorised pass.
+
+    `data` may be a str, bytes, bytearray, memoryview or mmap. Numbers are
+    found like parse_nums() would find them, counting ASCII digits only:
+    with negatives=True a "-" directly in front of the digits makes the
+    number negative. A str is scanned as UTF-8, where every other character
+    is made of bytes outside the ASCII range.
+
+    Arguments:
+        container: "list" (default), "array" for array('q'), or "numpy"
+            for an int64 ndarray.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    is_digit = (buf >= _ZERO) & (buf <= _ZERO + 9)
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    if len(starts) and lengths.max() > _MAX_DIGITS:
+        # Runs this long may not fit int64 (or are zero-padded); convert with
+        # Python's ints and only give up on int64 if a value doesn't fit.
+        found = (_BYTES_NUM_RE if negatives else _BYTES_POS_NUM_RE).findall(data)
+        values = [int(n) for n in found]
+        if container == "list":
+            return values
+        if not all(_INT64_MIN <= v <= _INT64_MAX for v in values):
+            if container == "numpy":
+                return np.array(values, dtype=object)
+            raise OverflowError("integers in buffer do not fit array('q')")
+        values = np.array(values, dtype=np.int64)
+    else:
+        values = _place_values(buf, is_digit, starts, ends, lengths, negatives)
+
+    if container == "numpy":
+        return values
+    if container == "array":
+        return array("q", values.tobytes())
+    return values.tolist()
+
+
+def _place_values(buf, is_digit, starts, ends, lengths, negatives):
+    """Sums the digits of every run of at most _MAX_DIGITS into int64."""
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    # Place value of every digit: 10 ** (digits left in its run).
+    digit_at = np.flatnonzero(is_digit)
+    run = np.repeat(np.arange(len(starts)), lengths)
+    power = ends[run] - digit_at - 1
+    weighted = (buf[digit_at] - _ZERO).astype(np.int64) * (10**power)
+    values = np.add.reduceat(weighted, np.cumsum(lengths) - lengths)
+    if negatives:
+        signed = starts > 0
+        signed[signed] = buf[starts[signed] - 1] == _MINUS
+        values[signed] *= -1
+    return values
+
+
+def mul(lst):
+    """Like sum(), but for multiplication."""
+    return reduce(operator.mul, lst, 1)  # NOQA
+
+
+def chunks(l, n):
+    """Yield successive n-sized chunks from l."""
+    for i in range(0, len(l), n):
+        yield l[i : i + n]
+
+
+def parts(l, n):
+    """Splits l into n equal parts. Excess (if it exists) returned as the n+1-th."""
+    m = len(l) // n
+    for i in range(0, n):
+        yield l[i * m : (i + 1) * m]
+
+    if len(l) % n != 0:
+        yield l[m * n :]
+
+
+def all_unique(lst):
+    """Returns True if all items in `lst` are unique."""
+    return len(lst) == len(set(lst))
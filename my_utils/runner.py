@@ -0,0 +1,509 @@
+"""Timed runs of solutions, singly or across a process pool."""
+
+import cProfile
+import importlib.util
+import io
+import json
+import math
+import os
+import pstats
+import signal
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .inputs import CACHE_DIR, load_input
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# The repository root, holding the YEAR/DD/solution.py directories.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+PHASES = ("parse_input", "part1", "part2")
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter, returns False where unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _peak_rss_kb() -> int:
+    """
+    Peak resident set size of this process in KiB.
+
+    Reads ``VmHWM`` on Linux so the value honours ``_reset_peak_rss``, and
+    falls back to ``ru_maxrss`` (peak since process start) elsewhere.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _timed(func, *args, profiler=None):
+    """
+    Call ``func(*args)`` and return ``(result, wall, cpu, peak_rss_kb)``.
+
+    When a ``cProfile.Profile`` is given the call runs under it, so the
+    timings include the profiler's overhead.
+    """
+    _reset_peak_rss()
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    if profiler is None:
+        result = func(*args)
+    else:
+        result = profiler.runcall(func, *args)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    return result, wall, cpu, _peak_rss_kb()
+
+
+def _frame_label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapse_stats(stats: pstats.Stats, min_us: int = 1) -> Counter:
+    """
+    Converts cProfile statistics into collapsed stacks for flame graphs.
+
+    cProfile only records caller/callee pairs, not whole stacks, so each
+    callee's time is split over its callers in proportion to the cumulative
+    time of every call edge. The shape is exact for call trees and an estimate
+    once a function is reached from more than one place.
+
+    Args:
+        stats (pstats.Stats): Profile statistics.
+        min_us (int): Drop frames that account for less than this.
+
+    Returns:
+        Counter: Microseconds of self time keyed by ``"root;...;leaf"``.
+    """
+    raw = stats.stats
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller].append((func, edge[3]))
+    # The profiler's own disable() call shows up as a root; leave it out.
+    roots = [
+        func
+        for func, row in raw.items()
+        if not row[4] and "_lsprof.Profiler" not in func[2]
+    ]
+    stacks = Counter()
+    todo = [(func, (), frozenset(), 1.0) for func in roots]
+    while todo:
+        func, path, active, scale = todo.pop()
+        _, _, tt, ct, _ = raw[func]
+        path += (_frame_label(func),)
+        self_us = round(tt * scale * 1e6)
+        if self_us >= min_us:
+            stacks[";".join(path)] += self_us
+        active |= {func}
+        for child, edge_ct in callees[func]:
+            child_ct = raw[child][3]
+            if child in active or child_ct <= 0:
+                continue
+            child_scale = scale * edge_ct / child_ct
+            if child_ct * child_scale * 1e6 >= min_us:
+                todo.append((child, path, active, child_scale))
+    return stacks
+
+
+def write_profile(profiler: cProfile.Profile, path: str, top: int = 15) -> str:
+    """
+    Writes ``<path>.prof`` and ``<path>.collapsed`` for a finished profile.
+
+    Args:
+        profiler (cProfile.Profile): The profile to save.
+        path (str): Output path without extension.
+        top (int): Number of functions in the returned summary.
+
+    Returns:
+        str: The ``top`` functions by cumulative time, as printed by pstats.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    profiler.dump_stats(f"{path}.prof")
+    with open(f"{path}.collapsed", "w") as f:
+        for stack, us in sorted(collapse_stats(pstats.Stats(profiler)).items()):
+            f.write(f"{stack} {us}\n")
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+    return summary.getvalue()
+
+
+def load_solution(year: int, day: int):
+    """
+    Imports ``<year>/<day>/solution.py`` from the repository root.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+
+    Returns:
+        module: The solution module.
+
+    Raises:
+        FileNotFoundError: If the solution file does not exist.
+    """
+    path = os.path.join(ROOT, str(year), f"{day:02d}", "solution.py")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No solution for {year} day {day}: {path}")
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    name = f"aoc_{year}_{day:02d}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_solution(
+    year: int,
+    day: int,
+    example: bool = False,
+    repeat: int = 1,
+    profile: str = None,
+    top: int = 15,
+) -> dict:
+    """
+    Runs a day's ``parse_input``, ``part1`` and ``part2`` and times each phase.
+
+    Each part gets freshly parsed data, so a part that mutates its input can't
+    leak into the other one; only the parse feeding ``part1`` is timed. Tuples
+    returned by ``parse_input`` are spread over the part arguments, like the
+    2023 tests do.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+        example (bool): Use ``example_input.txt`` instead of ``input.txt``.
+        repeat (int): Number of timed runs.
+        profile (str, optional): Profile each phase with cProfile and write
+            ``<phase>.prof`` and ``<phase>.collapsed`` to this directory. An
+            empty string means the day's ``.aoc_cache/profile``.
+        top (int): Functions per phase in the profile summary.
+
+    Returns:
+        dict: Report with the answers and, per phase, min/median wall and CPU
+        seconds plus the peak RSS in KiB. Profiled phases also carry the
+        ``profile`` path prefix and the pstats ``profile_summary``.
+
+    Raises:
+        AttributeError: If the module doesn't expose all three phases.
+    """
+    module = load_solution(year, day)
+    missing = [name for name in PHASES if not hasattr(module, name)]
+    if missing:
+        raise AttributeError(f"{year} day {day} does not define {', '.join(missing)}")
+    day_dir = os.path.dirname(module.__file__)
+    with load_input(day_dir, example=example) as puzzle:
+        lines = list(puzzle.lines())
+    profilers = dict.fromkeys(PHASES)
+    if profile is not None:
+        profile = profile or os.path.join(day_dir, CACHE_DIR, "profile")
+        profilers = {name: cProfile.Profile() for name in PHASES}
+
+    def spread(data):
+        return data if isinstance(data, tuple) else (data,)
+
+    samples = {name: [] for name in PHASES}
+    answers = {}
+    for _ in range(repeat):
+        data, *sample = _timed(
+            module.parse_input, list(lines), profiler=profilers["parse_input"]
+        )
+        samples["parse_input"].append(sample)
+        for part in PHASES[1:]:
+            if data is None:
+                data = module.parse_input(list(lines))
+            answers[part], *sample = _timed(
+                getattr(module, part), *spread(data), profiler=profilers[part]
+            )
+            samples[part].append(sample)
+            data = None
+
+    phases = {}
+    for name, runs in samples.items():
+        walls, cpus, peaks = zip(*runs)
+        phases[name] = {
+            "wall_min": min(walls),
+            "wall_median": statistics.median(walls),
+            "cpu_min": min(cpus),
+            "cpu_median": statistics.median(cpus),
+            "peak_rss_kb": max(peaks),
+        }
+        if name in answers:
+            answer = answers[name]
+            # Only check for numpy scalars if the solution loaded numpy.
+            np = sys.modules.get("numpy")
+            if np is not None and isinstance(answer, np.generic):
+                answer = answer.item()
+            phases[name]["answer"] = answer
+        if profile is not None:
+            path = os.path.join(profile, name)
+            phases[name]["profile_summary"] = write_profile(profilers[name], path, top)
+            phases[name]["profile"] = path
+    return {
+        "year": year,
+        "day": day,
+        "input": os.path.basename(puzzle.path),
+        "repeat": repeat,
+        "phases": phases,
+    }
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_report(report: dict) -> str:
+    """Renders a ``run_solution`` report as a plain-text table."""
+    header = (
+        "phase",
+        "answer",
+        "wall min",
+        "wall med",
+        "cpu min",
+        "cpu med",
+        "peak RSS",
+    )
+    rows = []
+    for name, phase in report["phases"].items():
+        rows.append(
+            (
+                name,
+                str(phase.get("answer", "")),
+                _format_seconds(phase["wall_min"]),
+                _format_seconds(phase["wall_median"]),
+                _format_seconds(phase["cpu_min"]),
+                _format_seconds(phase["cpu_median"]),
+                f"{phase['peak_rss_kb'] / 1024:.1f} MiB",
+            )
+        )
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    title = (
+        f"{report['year']} day {report['day']:02d}"
+        f" ({report['input']}, {report['repeat']} run{'s' * (report['repeat'] > 1)})"
+    )
+    lines = [title]
+    for row in (header, *rows):
+        lines.append(
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+        )
+    return "\n".join(lines)
+
+
+def find_solutions(years=None) -> list:
+    """
+    Lists the ``(year, day)`` pairs that have a ``solution.py``.
+
+    Args:
+        years (iterable, optional): Only include these years.
+
+    Returns:
+        list: Sorted ``(year, day)`` tuples.
+    """
+    wanted = set(years) if years else None
+    found = []
+    for year in os.listdir(ROOT):
+        if not year.isdigit() or (wanted and int(year) not in wanted):
+            continue
+        for day in os.listdir(os.path.join(ROOT, year)):
+            if day.isdigit() and os.path.isfile(
+                os.path.join(ROOT, year, day, "solution.py")
+            ):
+                found.append((int(year), int(day)))
+    return sorted(found)
+
+
+def _timings_path() -> str:
+    return os.path.join(ROOT, CACHE_DIR, "run_times.json")
+
+
+def _load_timings() -> dict:
+    try:
+        with open(_timings_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_timings(timings: dict) -> None:
+    path = _timings_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+
+def _init_worker(memory_mb: int) -> None:
+    """Silences the worker and caps its address space."""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+    if memory_mb and resource is not None:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError
+
+
+def _run_day(year: int, day: int, example: bool, timeout: float) -> dict:
+    """Worker entry point for ``run_all``, never raises."""
+    result = {"year": year, "day": day, "status": "ok", "error": None}
+    if timeout and hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    try:
+        result["report"] = run_solution(year, day, example)
+    except TimeoutError:
+        result["status"] = "timeout"
+        result["error"] = f"exceeded {timeout:g}s"
+    except MemoryError:
+        result["status"] = "memory"
+        result["error"] = "exceeded memory cap"
+    except BaseException as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if timeout and hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    result["wall"] = time.perf_counter() - start
+    return result
+
+
+def run_all(
+    years=None,
+    example: bool = False,
+    jobs: int = None,
+    timeout: float = 300.0,
+    memory_mb: int = 4096,
+) -> list:
+    """
+    Runs every day's solution in a process pool.
+
+    Each day gets a fresh worker process with its address space capped at
+    ``memory_mb`` and an interval timer of ``timeout`` seconds. Days are
+    submitted longest-first using the wall times recorded by the previous
+    run (unknown days go first), so a slow day doesn't end up last in the
+    queue and stretch the total.
+
+    Args:
+        years (iterable, optional): Only run these years.
+        example (bool): Use ``example_input.txt`` instead of ``input.txt``.
+        jobs (int, optional): Worker count, defaults to the CPU count.
+        timeout (float): Per-day time limit in seconds, 0 to disable.
+        memory_mb (int): Per-worker address-space cap in MiB, 0 to disable.
+
+    Returns:
+        list: One result dict per day, sorted by year and day, with a
+        ``status`` of ``ok``, ``error``, ``timeout``, ``memory`` or ``crashed``.
+    """
+    timings = _load_timings()
+    days = sorted(
+        find_solutions(years),
+        key=lambda d: -timings.get(f"{d[0]}/{d[1]:02d}", math.inf),
+    )
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count() or 1,
+        initializer=_init_worker,
+        initargs=(memory_mb,),
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = {
+            pool.submit(_run_day, year, day, example, timeout): (year, day)
+            for year, day in days
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                year, day = futures[future]
+                result = {
+                    "year": year,
+                    "day": day,
+                    "status": "crashed",
+                    "error": f"{type(e).__name__}: {e}",
+                    "wall": None,
+                }
+            results.append(result)
+    if not example:
+        for result in results:
+            if result["wall"] is not None:
+                timings[f"{result['year']}/{result['day']:02d}"] = result["wall"]
+        _save_timings(timings)
+    return sorted(results, key=lambda r: (r["year"], r["day"]))
+
+
+def _clip(text: str, width: int = 40) -> str:
+    text = text.splitlines()[0] if text else ""
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def format_run_all(results: list, elapsed: float) -> str:
+    """Renders ``run_all`` results as a plain-text table."""
+    header = ("day", "status", "part1", "part2", "time")
+    rows = []
+    for result in results:
+        phases = result.get("report", {}).get("phases", {})
+        rows.append(
+            (
+                f"{result['year']}/{result['day']:02d}",
+                result["status"],
+                _clip(str(phases.get("part1", {}).get("answer", ""))),
+                _clip(
+                    str(phases.get("part2", {}).get("answer", result["error"] or ""))
+                ),
+                "" if result["wall"] is None else _format_seconds(result["wall"]),
+            )
+        )
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.rjust(width) if i == 4 else cell.ljust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in (header, *rows)
+    ]
+    ok = sum(result["status"] == "ok" for result in results)
+    total = sum(result["wall"] or 0 for result in results)
+    lines.append(
+        f"{ok}/{len(results)} ok, {_format_seconds(total)} of work"
+        f" in {_format_seconds(elapsed)}"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+import unittest
+
+from my_utils import memoize
+
+
+class TestMemoize(unittest.TestCase):
+    def test_caches_by_arguments(self):
+        calls = []
+
+        @memoize
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        self.assertEqual(add(1, 23), 24)
+        self.assertEqual(add(12, 3), 15)
+        self.assertEqual(add(1, 23), 24)
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(calls, [(1, 23), (12, 3), (1, 2)])
+        info = add.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 3, 0))
+        self.assertEqual((info.maxsize, info.currsize), (None, 3))
+
+    def test_maxsize_evicts_least_recently_used(self):
+        @memoize(maxsize=2)
+        def square(x):
+            return x * x
+
+        square(1), square(2), square(1), square(3), square(2)
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 4, 2))
+        self.assertEqual(info.currsize, 2)
+
+    def test_failed_calls_are_not_evictions(self):
+        @memoize(maxsize=4)
+        def check(x):
+            if x < 0:
+                raise ValueError(x)
+            return x
+
+        for x in (1, -1, 2, -2):
+            try:
+                check(x)
+            except ValueError:
+                pass
+        self.assertEqual(check.cache_info().evictions, 0)
+
+    def test_typed(self):
+        @memoize(typed=True)
+        def kind(x):
+            return type(x).__name__
+
+        self.assertEqual((kind(1), kind(1.0)), ("int", "float"))
+
+    def test_cache_clear(self):
+        @memoize(maxsize=1)
+        def ident(x):
+            return x
+
+        ident(1), ident(2)
+        ident.cache_clear()
+        self.assertEqual(tuple(ident.cache_info()), (0, 0, 0, 1, 0))
+
+    def test_recursion(self):
+        @memoize
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        self.assertEqual(fib(200), 280571172992510140037611932413038677189525)
+
+    def test_rejects_bad_use(self):
+        with self.assertRaises(TypeError):
+
+            @memoize
+            def gen():
+                yield 1
+
+        with self.assertRaises(ValueError):
+            memoize(maxsize=0)(abs)
+        with self.assertRaises(TypeError):
+            memoize(len)([1])
+
+
+if __name__ == "__main__":
+    unittest.main()
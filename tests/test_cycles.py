@@ -0,0 +1,79 @@
+import unittest
+
+from my_utils import fast_forward, find_cycle
+
+
+def square_plus_one(n):
+    """x -> x * x + 1 (mod 101), which enters a cycle after a short tail."""
+    return (n * n + 1) % 101
+
+
+def iterate(step, state, n):
+    for _ in range(n):
+        state = step(state)
+    return state
+
+
+class TestFindCycle(unittest.TestCase):
+    def test_tail_and_length(self):
+        mu, lam = find_cycle(square_plus_one, 3)
+        seen = []
+        state = 3
+        while state not in seen:
+            seen.append(state)
+            state = square_plus_one(state)
+        self.assertEqual((mu, lam), (seen.index(state), len(seen) - seen.index(state)))
+
+    def test_pure_cycle(self):
+        self.assertEqual(find_cycle(lambda n: (n + 1) % 7, 0), (0, 7))
+
+    def test_key(self):
+        step = lambda s: (s[0] + 1, (s[1] + 1) % 5)  # NOQA
+        self.assertEqual(find_cycle(step, (0, 0), key=lambda s: s[1]), (0, 5))
+
+
+class TestFastForward(unittest.TestCase):
+    def test_matches_plain_iteration(self):
+        for n in (0, 1, 5, 17, 1000, 12345):
+            self.assertEqual(
+                fast_forward(square_plus_one, 3, n), iterate(square_plus_one, 3, n)
+            )
+
+    def test_huge_n(self):
+        n = 10**15 + 3
+        mu, lam = find_cycle(square_plus_one, 3)
+        expected = iterate(square_plus_one, 3, mu + (n - mu) % lam)
+        self.assertEqual(fast_forward(square_plus_one, 3, n), expected)
+
+    def test_observe_and_extrapolate(self):
+        # The height grows by 3 every cycle of length 4 after a tail of 2.
+        def step(state):
+            phase, height = state
+            if phase < 2:
+                return phase + 1, height + 10
+            return 2 + (phase - 1) % 4, height + (3 if phase == 5 else 0)
+
+        for n in (3, 50, 10**12 + 1):
+            expected = 20 + 3 * ((n - 2) // 4) if n >= 2 else 10 * n
+            if n <= 50:
+                self.assertEqual(iterate(step, (0, 0), n)[1], expected)
+            got = fast_forward(
+                step,
+                (0, 0),
+                n,
+                key=lambda s: s[0],
+                observe=lambda s: s[1],
+                extrapolate=True,
+            )
+            self.assertEqual(got, expected)
+
+    def test_mutating_step(self):
+        def step(state):
+            state[0] = (state[0] + 3) % 10
+            return state
+
+        self.assertEqual(fast_forward(step, [0], 10**9 + 1, key=tuple), [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
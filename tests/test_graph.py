@@ -0,0 +1,179 @@
+import heapq
+import random
+import unittest
+
+from my_utils import BucketQueue, CycleError, UnionFind, shortest_path, topsort
+
+
+def from_edges(edges):
+    graph = {}
+    for src, dst, weight in edges:
+        graph.setdefault(src, []).append((dst, weight))
+    return lambda state: graph.get(state, ())
+
+
+class TestShortestPath(unittest.TestCase):
+    def test_unit_weights(self):
+        adj = from_edges([("s", "a", 1), ("a", "b", 1), ("s", "b", 1), ("b", "c", 1)])
+        result = shortest_path(["s"], adj, goal="c")
+        self.assertEqual(result.cost, 2)
+        self.assertEqual(result.path(), ["s", "b", "c"])
+
+    def test_zero_one_weights(self):
+        adj = from_edges([("s", "a", 1), ("s", "b", 0), ("b", "c", 0), ("c", "a", 0)])
+        self.assertEqual(
+            shortest_path(["s"], adj).distances(), {"s": 0, "a": 0, "b": 0, "c": 0}
+        )
+
+    def test_weighted(self):
+        adj = from_edges([("s", "a", 9), ("s", "b", 1), ("b", "a", 1), ("a", "c", 3)])
+        result = shortest_path(["s"], adj, goal="c")
+        self.assertEqual(result.cost, 5)
+        self.assertEqual(result.path(), ["s", "b", "a", "c"])
+        self.assertEqual(result.distance("b"), 1)
+
+    def test_several_starts(self):
+        adj = from_edges([("s", "a", 5), ("t", "a", 2)])
+        self.assertEqual(shortest_path(["s", "t"], adj, goal="a").cost, 2)
+
+    def test_goal_predicate_and_unreachable(self):
+        adj = from_edges([("s", "a", 1)])
+        self.assertEqual(shortest_path(["s"], adj, goal=lambda s: s == "a").goal, "a")
+        result = shortest_path(["s"], adj, goal="z")
+        self.assertFalse(result)
+        self.assertIsNone(result.cost)
+        self.assertIsNone(result.path("z"))
+
+    def test_astar_on_a_line(self):
+        def adj(x):
+            yield x - 1, 2
+            yield x + 1, 2
+
+        result = shortest_path([0], adj, goal=10, heuristic=lambda x: 2 * abs(10 - x))
+        self.assertEqual(result.cost, 20)
+        self.assertEqual(result.path(), list(range(11)))
+
+    def test_float_weights_are_rejected(self):
+        adj = from_edges([("s", "a", 1.5)])
+        with self.assertRaisesRegex(TypeError, "integers"):
+            shortest_path(["s"], adj)
+
+    def test_bucket_queue_matches_heap(self):
+        rng = random.Random(4)
+        for _ in range(50):
+            adj = {
+                n: [(rng.randrange(12), rng.randint(0, 9)) for _ in range(3)]
+                for n in range(12)
+            }
+            heap = shortest_path([0], adj.__getitem__).distances()
+            buckets = shortest_path([0], adj.__getitem__, max_weight=9).distances()
+            self.assertEqual(buckets, heap)
+
+    def test_bucket_queue_low_weight_after_high(self):
+        adj = from_edges([("s", "a", 9), ("s", "b", 1), ("b", "a", 1)])
+        result = shortest_path(["s"], adj, max_weight=9)
+        self.assertEqual(result.distances(), {"s": 0, "a": 2, "b": 1})
+
+
+class TestBucketQueue(unittest.TestCase):
+    def test_pops_in_priority_order(self):
+        q = BucketQueue(9, [(3, "a"), (1, "b"), (9, "c")])
+        self.assertEqual(
+            [q.pop() for _ in range(len(q))], [(1, "b"), (3, "a"), (9, "c")]
+        )
+
+    def test_push_after_draining(self):
+        q = BucketQueue(9)
+        q.push((0, "s"))
+        q.pop()
+        q.push((9, "a"))
+        q.push((1, "b"))
+        self.assertEqual(q.pop(), (1, "b"))
+        self.assertEqual(q.pop(), (9, "a"))
+        q.push((30, "c"))
+        q.push((21, "d"))
+        self.assertEqual(q.pop(), (21, "d"))
+
+    def test_interleaved_push_and_pop_matches_heapq(self):
+        rng = random.Random(1)
+        q, heap = BucketQueue(5), []
+        floor = 0
+        for step in range(2000):
+            if heap and rng.random() < 0.5:
+                item = q.pop()
+                self.assertEqual(item[0], heapq.heappop(heap)[0])
+                floor = item[0]
+            else:
+                item = (floor + rng.randint(0, 5), step)
+                q.push(item)
+                heapq.heappush(heap, item)
+            self.assertEqual(len(q), len(heap))
+
+    def test_rejects_priorities_outside_the_window(self):
+        q = BucketQueue(3, [(5, "a")])
+        with self.assertRaises(ValueError):
+            q.push((9, "b"))
+        with self.assertRaises(ValueError):
+            q.push((1, "c"))
+        q.pop()
+        with self.assertRaises(IndexError):
+            q.pop()
+
+
+class TestUnionFind(unittest.TestCase):
+    def test_merge_and_find(self):
+        uf = UnionFind(6)
+        uf.merge(0, 1)
+        uf.merge(2, 3)
+        uf.merge(1, 3)
+        uf.merge(0, 2)
+        self.assertTrue(uf.in_same_set(0, 3))
+        self.assertFalse(uf.in_same_set(0, 4))
+        self.assertEqual((uf.num_sets, uf.size(2), uf.size(5)), (3, 4, 1))
+
+    def test_long_chain_does_not_recurse(self):
+        n = 200000
+        uf = UnionFind(n)
+        for i in range(n - 1):
+            uf.merge(i, i + 1)
+        self.assertEqual((uf.num_sets, uf.size(0)), (1, n))
+
+    def test_merge_edges_labels_and_sizes(self):
+        uf = UnionFind(7)
+        uf.merge_edges([0, 5, 3, 1], [1, 6, 4, 0])
+        self.assertEqual(uf.num_sets, 4)
+        self.assertEqual(uf.labels().tolist(), [0, 0, 1, 2, 2, 3, 3])
+        self.assertEqual(uf.component_sizes().tolist(), [2, 1, 2, 2])
+
+
+class TestTopsort(unittest.TestCase):
+    def test_orders_every_edge(self):
+        graph = {"shirt": ["tie", "belt"], "tie": ["jacket"], "pants": ["belt"]}
+        order = topsort(graph)
+        self.assertEqual(set(order), {"shirt", "tie", "belt", "jacket", "pants"})
+        for src, dsts in graph.items():
+            for dst in dsts:
+                self.assertLess(order.index(src), order.index(dst))
+
+    def test_tiebreak(self):
+        graph = {"c": ["a"], "b": ["a"], "d": []}
+        self.assertEqual(topsort(graph), ["b", "c", "a", "d"])
+        self.assertEqual(
+            topsort(graph, tiebreak=lambda n: -ord(n)), ["d", "c", "b", "a"]
+        )
+
+    def test_subset_of_nodes(self):
+        graph = {1: [2, 3], 2: [4], 3: [4], 4: []}
+        self.assertEqual(topsort(graph, nodes=[4, 3, 1]), [1, 3, 4])
+
+    def test_cycle(self):
+        with self.assertRaises(CycleError) as caught:
+            topsort({"a": ["b"], "b": ["c"], "c": ["a"], "x": ["a"]})
+        cycle = caught.exception.cycle
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(sorted(cycle[:-1]), ["a", "b", "c"])
+        self.assertIsInstance(caught.exception, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from my_utils import CACHE_DIR, load_input
+
+SOLUTION = """\
+calls = []
+
+
+def parse_input(lines):
+    calls.append(len(lines))
+    return [int(line) for line in lines]
+"""
+
+
+def import_as(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestPuzzleInput(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.day = self.tmp.name
+        with open(os.path.join(self.day, "input.txt"), "w") as f:
+            f.write("1\r\n22\n333")
+        self.solution = os.path.join(self.day, "solution.py")
+        with open(self.solution, "w") as f:
+            f.write(SOLUTION)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def cache_files(self):
+        return sorted(os.listdir(os.path.join(self.day, CACHE_DIR)))
+
+    def test_lines_and_text(self):
+        puzzle = load_input(self.solution)
+        self.assertEqual(list(puzzle.lines()), ["1", "22", "333"])
+        self.assertEqual(len(puzzle), 9)
+        self.assertEqual(puzzle.text(), "1\r\n22\n333")
+
+    def test_map_is_closed_after_use(self):
+        puzzle = load_input(self.solution)
+        list(puzzle.lines())
+        self.assertIsNone(puzzle._data)
+        module = import_as("day_solution", self.solution)
+        self.assertEqual(puzzle.parse(module.parse_input), [1, 22, 333])
+        self.assertIsNone(puzzle._data)
+        with load_input(self.solution) as puzzle:
+            next(puzzle.lines())
+        self.assertIsNone(puzzle._data)
+
+    def test_parse_is_cached(self):
+        module = import_as("day_solution", self.solution)
+        for _ in range(3):
+            self.assertEqual(
+                load_input(self.solution).parse(module.parse_input), [1, 22, 333]
+            )
+        self.assertEqual(module.calls, [3])
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_module_names_keep_their_own_caches(self):
+        first = import_as("solution", self.solution)
+        second = import_as("aoc_2099_01", self.solution)
+        for module in (first, second, first, second):
+            load_input(self.solution).parse(module.parse_input)
+        self.assertEqual((first.calls, second.calls), ([3], [3]))
+        self.assertEqual(len(self.cache_files()), 2)
+
+    def test_changed_input_replaces_the_entry(self):
+        module = import_as("day_solution", self.solution)
+        load_input(self.solution).parse(module.parse_input)
+        with open(os.path.join(self.day, "input.txt"), "w") as f:
+            f.write("4\n5")
+        self.assertEqual(load_input(self.solution).parse(module.parse_input), [4, 5])
+        self.assertEqual(len(self.cache_files()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
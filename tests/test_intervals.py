@@ -0,0 +1,191 @@
+import random
+import unittest
+
+from my_utils import IntervalSet, PiecewiseOffsetMap
+
+
+def covered(spans):
+    return {x for start, stop in spans for x in range(start, stop)}
+
+
+def random_spans(rng, count, low=-20, high=60):
+    spans = []
+    for _ in range(count):
+        start = rng.randrange(low, high)
+        spans.append((start, start + rng.randrange(0, 12)))
+    return spans
+
+
+def random_map(rng, count, low=-20, high=60):
+    m = PiecewiseOffsetMap()
+    for start, stop in random_spans(rng, count, low, high):
+        try:
+            m.add(start, stop, rng.randrange(-30, 31))
+        except ValueError:
+            pass
+    return m
+
+
+class TestIntervalSet(unittest.TestCase):
+    def test_add_merges_touching_spans(self):
+        s = IntervalSet([(0, 5), (10, 15)])
+        s.add(5, 8)
+        self.assertEqual(list(s), [(0, 8), (10, 15)])
+        s.add(8, 10)
+        self.assertEqual(list(s), [(0, 15)])
+        s.add(3, 3)
+        self.assertEqual(list(s), [(0, 15)])
+        self.assertEqual(len(s), 15)
+        self.assertEqual(s.span_count, 1)
+        self.assertEqual(s.bounds(), (0, 15))
+
+    def test_discard_splits_spans(self):
+        s = IntervalSet([(0, 20)])
+        s.discard(5, 8)
+        self.assertEqual(list(s), [(0, 5), (8, 20)])
+        s.discard(-5, 2)
+        s.discard(15, 30)
+        self.assertEqual(list(s), [(2, 5), (8, 15)])
+        self.assertEqual(len(s), 10)
+        s.discard(0, 30)
+        self.assertFalse(s)
+        self.assertIsNone(s.bounds())
+
+    def test_contains_and_gaps(self):
+        s = IntervalSet([(0, 5), (10, 15)])
+        self.assertEqual([x for x in range(-2, 17) if x in s], sorted(covered(s)))
+        self.assertEqual(list(s.gaps(0, 20)), [(5, 10), (15, 20)])
+        self.assertEqual(list(s.gaps(2, 4)), [])
+        self.assertEqual(list(s.overlapping(3, 12)), [(3, 5), (10, 12)])
+
+    def test_matches_a_set_of_integers(self):
+        rng = random.Random(20)
+        for _ in range(200):
+            s, expected = IntervalSet(), set()
+            for start, stop in random_spans(rng, 8):
+                if rng.random() < 0.3:
+                    s.discard(start, stop)
+                    expected -= set(range(start, stop))
+                else:
+                    s.add(start, stop)
+                    expected |= set(range(start, stop))
+            self.assertEqual(covered(s), expected)
+            self.assertEqual(len(s), len(expected))
+            spans = list(s)
+            # Canonical: sorted, non-empty and never touching.
+            for (_, stop), (start, _) in zip(spans, spans[1:]):
+                self.assertLess(stop, start)
+            self.assertTrue(all(start < stop for start, stop in spans))
+
+    def test_set_operations(self):
+        rng = random.Random(21)
+        for _ in range(200):
+            a = IntervalSet(random_spans(rng, 6))
+            b = IntervalSet(random_spans(rng, 6))
+            for result, expected in (
+                (a | b, covered(a) | covered(b)),
+                (a & b, covered(a) & covered(b)),
+                (a - b, covered(a) - covered(b)),
+            ):
+                self.assertEqual(covered(result), expected)
+                self.assertEqual(len(result), len(expected))
+                self.assertEqual(result, IntervalSet(result))
+
+    def test_copy_is_independent(self):
+        s = IntervalSet([(0, 10)])
+        t = s.copy()
+        t.discard(2, 4)
+        self.assertEqual(list(s), [(0, 10)])
+        self.assertEqual(len(t), 8)
+
+
+class TestPiecewiseOffsetMap(unittest.TestCase):
+    def test_getitem(self):
+        m = PiecewiseOffsetMap([(98, 100, -48), (50, 98, 2)])
+        self.assertEqual(list(m), [(50, 98, 2), (98, 100, -48)])
+        self.assertEqual(m[99], 51)
+        self.assertEqual(m[50], 52)
+        self.assertEqual(m[49], 49)
+        self.assertEqual(m[100], 100)
+
+    def test_add_rejects_overlap(self):
+        m = PiecewiseOffsetMap([(10, 20, 1)])
+        for start, stop in ((5, 11), (19, 25), (12, 15), (0, 30)):
+            with self.assertRaises(ValueError):
+                m.add(start, stop, 3)
+        m.add(20, 25, 3)
+        m.add(5, 10, 3)
+        m.add(7, 7, 3)
+        self.assertEqual(len(m), 3)
+
+    def test_pieces_and_map_range(self):
+        m = PiecewiseOffsetMap([(98, 100, -48), (50, 98, 2)])
+        self.assertEqual(
+            list(m.pieces(40, 102)),
+            [(40, 50, 0), (50, 98, 2), (98, 100, -48), (100, 102, 0)],
+        )
+        self.assertEqual(list(m.map_range(90, 102)), [(92, 100), (50, 52), (100, 102)])
+        self.assertEqual(list(m.pieces(0, 10)), [(0, 10, 0)])
+
+    def test_map_set_matches_pointwise(self):
+        rng = random.Random(22)
+        for _ in range(100):
+            m = random_map(rng, 6)
+            spans = IntervalSet(random_spans(rng, 4))
+            expected = {m[x] for x in covered(spans)}
+            self.assertEqual(covered(m.map_set(spans)), expected)
+
+    def test_then_composes(self):
+        rng = random.Random(23)
+        for _ in range(200):
+            m, n = random_map(rng, 5), random_map(rng, 5)
+            composed = m.then(n)
+            for x in range(-60, 100):
+                self.assertEqual(composed[x], n[m[x]])
+            # No zero-offset spans, and neighbours never share an offset.
+            spans = list(composed)
+            self.assertTrue(all(offset != 0 for _, _, offset in spans))
+            for (_, stop, a), (start, _, b) in zip(spans, spans[1:]):
+                self.assertTrue(stop < start or a != b)
+
+    def test_then_chain(self):
+        rng = random.Random(24)
+        maps = [random_map(rng, 4) for _ in range(7)]
+        chained = PiecewiseOffsetMap()
+        for m in maps:
+            chained = chained.then(m)
+        for x in range(-100, 150):
+            y = x
+            for m in maps:
+                y = m[y]
+            self.assertEqual(chained[x], y)
+
+    def test_then_cancelling_offsets(self):
+        m = PiecewiseOffsetMap([(0, 10, 5)])
+        n = PiecewiseOffsetMap([(5, 15, -5)])
+        self.assertEqual(list(m.then(n)), [(10, 15, -5)])
+        self.assertEqual(list(m.then(PiecewiseOffsetMap())), list(m))
+
+    def test_map_points_matches_getitem(self):
+        rng = random.Random(25)
+        points = list(range(-40, 90))
+        for _ in range(100):
+            m = random_map(rng, 6)
+            self.assertEqual(m.map_points(points).tolist(), [m[x] for x in points])
+
+    def test_map_points_shape_and_edges(self):
+        m = PiecewiseOffsetMap([(0, 5, 10), (5, 8, -3), (20, 30, 1)])
+        breakpoints, offsets = m.as_arrays()
+        self.assertEqual(breakpoints.tolist(), [0, 5, 8, 20, 30])
+        self.assertEqual(offsets.tolist(), [0, 10, -3, 0, 1, 0])
+        grid = [[-1, 0, 4, 5], [7, 8, 29, 30]]
+        mapped = m.map_points(grid)
+        self.assertEqual(mapped.shape, (2, 4))
+        self.assertEqual(mapped.tolist(), [[m[x] for x in row] for row in grid])
+        self.assertEqual(PiecewiseOffsetMap().map_points([3, -3]).tolist(), [3, -3])
+        big = [2**62, -(2**62)]
+        self.assertEqual(m.map_points(big).tolist(), big)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import warnings
+
+from my_utils import logs
+
+
+@unittest.skipIf(logs.logger is None, "loguru is not installed")
+class TestSetupLogging(unittest.TestCase):
+    def setUp(self):
+        self.saved = (logs._log_level, logs.DEBUG_ENABLED)
+        logs.setup_logging("INFO", force=True)
+
+    def tearDown(self):
+        logs.setup_logging(self.saved[0] or "INFO", force=True)
+
+    def test_later_calls_keep_level(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertIs(logs.setup_logging(), logs.log)
+            logs.setup_logging("info")
+        self.assertEqual(logs._log_level, "INFO")
+        self.assertFalse(logs.DEBUG_ENABLED)
+
+    def test_different_level_warns(self):
+        with self.assertWarns(RuntimeWarning):
+            logs.setup_logging("DEBUG")
+        self.assertEqual(logs._log_level, "INFO")
+
+    def test_force_changes_level(self):
+        logs.setup_logging("DEBUG", force=True)
+        self.assertEqual(logs._log_level, "DEBUG")
+        self.assertTrue(logs.DEBUG_ENABLED)
+        logs.setup_logging()
+        self.assertEqual(logs._log_level, "DEBUG")
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            logs.setup_logging("LOUD")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from my_utils import (
+    crt,
+    crt_merge,
+    egcd,
+    factors,
+    gcd,
+    lcm,
+    linear_congruence,
+    modinv,
+    prime_factors,
+    solve_congruences,
+)
+from my_utils.number_theory import Sieve
+
+
+class TestSieve(unittest.TestCase):
+    def setUp(self):
+        self.sieve = Sieve()
+
+    def test_is_prime_mixes_small_and_large(self):
+        values = [1, 2, 97, 100, 2**24 + 43, 3 * 10**9 + 19, 3 * 10**9 + 21]
+        expected = [self.sieve.is_prime(n) for n in values]
+        self.assertEqual(self.sieve.is_prime(values).tolist(), expected)
+        self.assertEqual(expected, [False, True, True, False, True, True, False])
+        self.assertLessEqual(self.sieve.limit, 2 * (Sieve.TRIAL_LIMIT + 1))
+
+    def test_is_prime_keeps_shape(self):
+        result = self.sieve.is_prime(np.array([[2, 4], [3 * 10**9 + 19, 9]]))
+        self.assertEqual(result.tolist(), [[True, False], [True, False]])
+
+    def test_factorise_many_mixes_small_and_large(self):
+        values = [12, 1, 3 * 10**9 + 19, 2**31 + 2, 97]
+        rows = self.sieve.factorise_many(values).tolist()
+        for n, row in zip(values, rows):
+            self.assertEqual([p for p in row if p != 1], prime_factors(n))
+        self.assertLessEqual(self.sieve.limit, 2 * (Sieve.TRIAL_LIMIT + 1))
+
+    def test_prime_factors_past_trial_limit(self):
+        p, q = 16777259, 16777289
+        self.assertEqual(self.sieve.prime_factors(p * q), [p, q])
+        self.assertEqual(self.sieve.prime_factors(2 * p * p), [2, p, p])
+        self.assertEqual(self.sieve.prime_factors(2**61 - 1), [2**61 - 1])
+        self.assertEqual(self.sieve.prime_factors(2**64 + 1), [274177, 67280421310721])
+
+    def test_factors(self):
+        self.assertEqual(factors(0), [])
+        self.assertEqual(factors(1), [1])
+        self.assertEqual(factors(36), [1, 2, 3, 4, 6, 9, 12, 18, 36])
+
+
+class TestCongruences(unittest.TestCase):
+    def test_gcd_lcm_are_exact(self):
+        self.assertEqual(gcd(12, 18, 27), 3)
+        big = [2**61 - 1, 2**31 - 1, 10**9 + 7]
+        self.assertEqual(lcm(*big), (2**61 - 1) * (2**31 - 1) * (10**9 + 7))
+
+    def test_egcd_and_modinv(self):
+        g, x, y = egcd(240, 46)
+        self.assertEqual((g, 240 * x + 46 * y), (2, 2))
+        self.assertEqual(modinv(3, 11) * 3 % 11, 1)
+        with self.assertRaises(ValueError):
+            modinv(4, 10)
+
+    def test_crt(self):
+        self.assertEqual(crt([2, 3, 2], [3, 5, 7]), (23, 105))
+        # Moduli need not be coprime.
+        self.assertEqual(crt([3, 5], [4, 6]), (11, 12))
+        self.assertEqual(crt_merge(1, 4, 3, 6), (9, 12))
+        with self.assertRaises(ValueError):
+            crt([0, 1], [4, 6])
+
+    def test_linear_congruences(self):
+        self.assertEqual(linear_congruence(6, 4, 10), (4, 5))
+        with self.assertRaises(ValueError):
+            linear_congruence(6, 3, 10)
+        x, m = solve_congruences([(3, 2, 5), (2, 4, 6), (1, 0, 7)])
+        self.assertEqual(m, 105)
+        self.assertEqual([3 * x % 5, 2 * x % 6, x % 7], [2, 4, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from my_utils import extract_ints, parse_line, parse_nums
+
+
+class TestExtractInts(unittest.TestCase):
+    def test_matches_parse_nums(self):
+        line = "Sensor at x=-2, y=15: 7-3 and 042"
+        self.assertEqual(extract_ints(line), parse_nums(line))
+        self.assertEqual(extract_ints(line, negatives=False), parse_nums(line, False))
+
+    def test_non_ascii_text(self):
+        self.assertEqual(extract_ints("a → 5"), [5])
+        self.assertEqual(extract_ints("€-12 ✓ 3é4"), [-12, 3, 4])
+        self.assertEqual(extract_ints("→ 5".encode("utf-8")), [5])
+
+    def test_too_long_for_int64(self):
+        line = "→ 12345678901234567890 -3"
+        self.assertEqual(extract_ints(line), [12345678901234567890, -3])
+
+    def test_zero_padded_fits_int64(self):
+        line = "x=0000000000000000000000012, y=-0000000000000000000000005"
+        self.assertEqual(extract_ints(line, container="array").tolist(), [12, -5])
+        self.assertEqual(extract_ints(line, container="numpy").dtype.name, "int64")
+        with self.assertRaises(OverflowError):
+            extract_ints("99999999999999999999", container="array")
+
+
+class TestParseLine(unittest.TestCase):
+    def test_converts_what_int_accepts(self):
+        self.assertEqual(
+            parse_line(r"(.*),(.*),(.*),(\w+)", " 12,-3 ,1_000,abc"),
+            [12, -3, 1000, "abc"],
+        )
+
+    def test_leaves_other_groups_alone(self):
+        self.assertEqual(parse_line(r"(\S+) (\S+)(x)?", "--5 1e3"), ["--5", "1e3"])
+
+
+if __name__ == "__main__":
+    unittest.main()